@@ -0,0 +1,7 @@
+"""
+Run the game of pyfe application with `python -m game_of_pyfe`.
+"""
+
+from .cli import main
+
+main()
@@ -0,0 +1,147 @@
+"""
+Registry of the kernels that compute the generations of game of pyfe.
+
+A backend is a function step(board, mode, rule, out=None) returning the
+next generation of a (n, m) board with the dtype of the board, written in
+`out` when it is given. update_board and evolve_board use the backend
+given in their `backend` argument, or the default one:
+
+1. numpy: The vectorized field sums and rule lookup of game_of_pyfe.core.
+2. numba: A kernel compiled with numba that counts the neighbors and
+   applies the rule in a single pass, in parallel over the rows, see
+   game_of_pyfe.jit. It requires the optional numba package.
+
+The backends are imported the first time they are used. When a backend
+can not be imported, a RuntimeWarning is given and the numpy backend is
+used instead.
+"""
+
+import importlib
+import warnings
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Backend used when the requested one is not available.
+FALLBACK = "numpy"
+
+Step = Callable[..., np.array]
+
+# Module, relative to the package, and attribute of the step of each backend.
+_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "numpy": (".core", "_step"),
+    "numba": (".jit", "step"),
+}
+_loaded: Dict[str, Step] = {}
+# Import error of each backend that is not available.
+_unavailable: Dict[str, ImportError] = {}
+_default = FALLBACK
+
+
+def register_backend(name: str, module: str, attribute: str) -> None:
+    """Add a backend, or replace the one with the same name.
+
+    Arguments
+    ---------
+    name: Name of the backend.
+    module: Module with the step of the backend, absolute or relative to
+    game_of_pyfe. It is imported the first time the backend is used.
+    attribute: Name of the step in the module.
+    """
+    _REGISTRY[name] = (module, attribute)
+    _loaded.pop(name, None)
+    _unavailable.pop(name, None)
+
+
+def _load(name: str) -> bool:
+    """Import the step of a backend, if it was not tried before.
+
+    Returns
+    -------
+    True if the backend is available.
+
+    Raises
+    ------
+    TypeError if the backend is not registered.
+    """
+    if name not in _REGISTRY:
+        raise TypeError("Backend not defined.")
+
+    if name not in _loaded and name not in _unavailable:
+        module, attribute = _REGISTRY[name]
+        try:
+            _loaded[name] = getattr(
+                importlib.import_module(module, __package__), attribute
+            )
+        except ImportError as error:
+            _unavailable[name] = error
+
+    return name in _loaded
+
+
+def resolve_backend(name: str = None) -> str:
+    """Obtain the backend that computes the generations for a requested one.
+
+    Arguments
+    ---------
+    name: Name of the backend, by default the default backend.
+
+    Returns
+    -------
+    the name of the backend, or the name of the fallback one with a
+    RuntimeWarning if it is not available.
+
+    Raises
+    ------
+    TypeError if the backend is not registered.
+    """
+    if name is None:
+        name = _default
+
+    if not _load(name):
+        warnings.warn(
+            "Backend {} is not available ({}), using {} instead.".format(
+                name, _unavailable[name], FALLBACK
+            ),
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        name = FALLBACK
+        _load(name)
+
+    return name
+
+
+def get_backend(name: str = None) -> Step:
+    """Obtain the step of a backend, see resolve_backend."""
+    return _loaded[resolve_backend(name)]
+
+
+def available_backends() -> List[str]:
+    """Obtain the names of the backends that can be imported."""
+    return [name for name in _REGISTRY if _load(name)]
+
+
+def set_default_backend(name: str) -> str:
+    """Change the backend used when none is given.
+
+    Arguments
+    ---------
+    name: Name of the backend. It is not imported until it is used.
+
+    Returns
+    -------
+    the name of the previous default backend.
+
+    Raises
+    ------
+    TypeError if the backend is not registered.
+    """
+    global _default
+
+    if name not in _REGISTRY:
+        raise TypeError("Backend not defined.")
+
+    previous, _default = _default, name
+
+    return previous
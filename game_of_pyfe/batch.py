@@ -0,0 +1,123 @@
+"""
+Batched game of life implementation.
+
+A stack of independent boards with shape (B, n, m) is advanced at the
+same time, so the cost of many small boards is paid in a few array
+operations per generation instead of a Python loop per board.
+"""
+
+from typing import Literal, Sequence, Union
+
+import numpy as np
+
+from .core import _apply_rule, _neighborhood_sum, _pad_board, as_cells
+from .rules import CONWAY, Rule, parse_rule
+
+Modes = Union[Literal["wrap", "zeros"], Sequence[Literal["wrap", "zeros"]]]
+
+
+def _pad_boards(boards: np.array, mode: Modes) -> np.array:
+    """Pad each board of the stack with its own edge mode."""
+    if isinstance(mode, str):
+        return _pad_board(boards, mode)
+
+    mode = np.asarray(mode)
+    assert mode.shape == boards.shape[:1]
+
+    if not np.isin(mode, ["wrap", "zeros"]).all():
+        raise TypeError("Mode not defined.")
+
+    padded_boards = _pad_board(boards, "wrap")
+
+    zeros = mode == "zeros"
+    padded_boards[zeros, 0] = 0
+    padded_boards[zeros, -1] = 0
+    padded_boards[zeros, :, 0] = 0
+    padded_boards[zeros, :, -1] = 0
+
+    return padded_boards
+
+
+def update_boards(
+    boards: np.array, mode: Modes = "wrap", rule: Union[str, Rule] = CONWAY
+) -> np.array:
+    """Move every board of a stack one generation in the game of life.
+
+    The operation is inmutable.
+
+    Arguments
+    ---------
+    boards: Stack of game of life boards with shape (B, n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior shared by every board, or a sequence with the
+    edge behavior of each board.
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    new stack of boards one generation older with shape (B, n, m)
+    """
+    boards_shape = boards.shape
+    assert len(boards_shape) == 3
+    assert boards_shape[1] >= 2 and boards_shape[2] >= 2
+
+    boards = as_cells(boards)
+    total = _neighborhood_sum(_pad_boards(boards, mode))
+
+    return _apply_rule(boards, total, parse_rule(rule))
+
+
+def evolve_boards(
+    boards: np.array,
+    n_times: int,
+    mode: Modes = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """
+    Iterate through a stack of boards `n` generations.
+
+    Arguments
+    ---------
+    boards: Stack of game of life boards with shape (B, n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior shared by every board, or a sequence with the
+    edge behavior of each board.
+    rule: Life-like rule or its B/S notation.
+
+    Yields
+    ------
+    a new stack of boards with the state the current generation.
+    """
+    rule = parse_rule(rule)
+
+    new_boards = as_cells(boards)
+    for _ in range(n_times):
+        new_boards = update_boards(new_boards, mode, rule)
+        yield new_boards
+
+
+def advance_boards(
+    boards: np.array,
+    n_times: int,
+    mode: Modes = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """Advance a stack of boards `n` generations, keeping only the last one.
+
+    Arguments
+    ---------
+    boards: Stack of game of life boards with shape (B, n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior shared by every board, or a sequence with the
+    edge behavior of each board.
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    new stack of boards `n` generations older with shape (B, n, m)
+    """
+    new_boards = as_cells(boards).copy()
+    for new_boards in evolve_boards(boards, n_times, mode, rule):
+        pass
+
+    return new_boards
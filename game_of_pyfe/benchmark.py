@@ -0,0 +1,398 @@
+"""
+Benchmark suite for game of pyfe.
+
+Measures the cells processed per second and the peak memory of the hot
+paths for several board sizes, densities of living cells and edge modes.
+The results can be saved to JSON and compared against a baseline saved
+in a previous run, reporting the benchmarks that got slower or use more
+memory.
+
+Run it with:
+
+    python -m game_of_pyfe.benchmark --sizes 64 1024 --output results.json
+    python -m game_of_pyfe.benchmark --sizes 64 1024 --baseline results.json
+
+With --startup, the time to print the help and to run a small board in a
+new process is also measured.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .core import evolve_board, generate_fields, update_board
+from .packed import evolve_packed_board
+from .utils import validate_board
+
+SIZES = (64, 256, 1024, 4096, 8192)
+DENSITIES = (0.1, 0.5)
+MODES = ("wrap", "zeros")
+# Generations run by the benchmarks that evolve boards.
+GENERATIONS = 10
+
+
+def _update_board(board: np.array, mode: str) -> int:
+    update_board(board, mode)
+    return board.size
+
+
+def _generate_fields(board: np.array, mode: str) -> int:
+    generate_fields(board, mode).sum(axis=(2, 3), dtype=np.uint8)
+    return board.size
+
+
+def _evolve_board(board: np.array, mode: str) -> int:
+    for _ in evolve_board(board, GENERATIONS, mode):
+        pass
+    return board.size * GENERATIONS
+
+
+def _evolve_board_reuse_buffers(board: np.array, mode: str) -> int:
+    for _ in evolve_board(board, GENERATIONS, mode, reuse_buffers=True):
+        pass
+    return board.size * GENERATIONS
+
+
+def _evolve_packed_board(board: np.array, mode: str) -> int:
+    for _ in evolve_packed_board(board, GENERATIONS, mode):
+        pass
+    return board.size * GENERATIONS
+
+
+def _validate_board(board: np.array, mode: str) -> int:
+    # The boards loaded from the configuration file are int64, the time
+    # includes creating the int64 board.
+    validate_board(board.astype(np.int64))
+    return board.size
+
+
+# Each benchmark runs over a board and returns the number of cells processed.
+BENCHMARKS: Dict[str, Callable[[np.array, str], int]] = {
+    "update_board": _update_board,
+    "generate_fields": _generate_fields,
+    "evolve_board": _evolve_board,
+    "evolve_board_reuse_buffers": _evolve_board_reuse_buffers,
+    "evolve_packed_board": _evolve_packed_board,
+    "validate_board": _validate_board,
+}
+
+
+def random_board(size: int, density: float, seed: int = 0) -> np.array:
+    """Create a square uint8 board with the given density of living cells."""
+    rng = np.random.default_rng(seed)
+
+    return (rng.random((size, size)) < density).astype(np.uint8)
+
+
+def run_benchmark(
+    name: str, size: int, density: float, mode: str, repeat: int = 3
+) -> Dict:
+    """Measure a benchmark.
+
+    The time is the best of `repeat` runs, and the peak memory is traced
+    in an extra run, since tracing slows down the allocations.
+
+    Arguments
+    ---------
+    name: Name of the benchmark in BENCHMARKS.
+    size: Number of rows and columns of the board.
+    density: Fraction of living cells.
+    mode: Edge behavior, "wrap" or "zeros".
+    repeat: Number of timed runs.
+
+    Returns
+    -------
+    The result with the benchmark, size, density, mode, seconds,
+    cells_per_second and peak_bytes keys.
+    """
+    benchmark = BENCHMARKS[name]
+    board = random_board(size, density)
+
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cells = benchmark(board, mode)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        benchmark(board, mode)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "benchmark": name,
+        "size": size,
+        "density": density,
+        "mode": mode,
+        "seconds": seconds,
+        "cells_per_second": cells / seconds,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def run_suite(
+    benchmarks: Sequence[str] = tuple(BENCHMARKS),
+    sizes: Sequence[int] = SIZES,
+    densities: Sequence[float] = DENSITIES,
+    modes: Sequence[str] = MODES,
+    repeat: int = 3,
+    report: Optional[Callable[[Dict], None]] = None,
+) -> List[Dict]:
+    """Measure every combination of benchmark, size, density and mode.
+
+    Arguments
+    ---------
+    benchmarks: Names of the benchmarks in BENCHMARKS.
+    sizes: Number of rows and columns of the boards.
+    densities: Fractions of living cells.
+    modes: Edge behaviors.
+    repeat: Number of timed runs of each combination.
+    report: Called with each result as soon as it is measured.
+
+    Returns
+    -------
+    The list of results, as returned by run_benchmark.
+    """
+    results = []
+    for name in benchmarks:
+        for size in sizes:
+            for density in densities:
+                for mode in modes:
+                    result = run_benchmark(name, size, density, mode, repeat)
+                    if report is not None:
+                        report(result)
+                    results.append(result)
+
+    return results
+
+
+def _time_command(argv: Sequence[str], repeat: int) -> float:
+    """Best wall time of running the application with the arguments."""
+    # The package is importable even when it is not installed.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "game_of_pyfe", *argv],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        seconds = min(seconds, time.perf_counter() - start)
+
+    return seconds
+
+
+def run_startup(repeat: int = 3, size: int = 64) -> List[Dict]:
+    """Measure the start up of the application in a new process.
+
+    Two cases are measured, printing the help and a headless run of a
+    small board.
+
+    Arguments
+    ---------
+    repeat: Number of timed runs.
+    size: Number of rows and columns of the board of the headless run.
+
+    Returns
+    -------
+    The results, as returned by run_benchmark, without peak_bytes.
+    """
+    results = [
+        {
+            "benchmark": "startup_help",
+            "size": 0,
+            "density": 0.0,
+            "mode": "wrap",
+            "seconds": _time_command(["--help"], repeat),
+            "cells_per_second": None,
+            "peak_bytes": None,
+        }
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        conf_file = os.path.join(directory, "conf.json")
+        with open(conf_file, "w") as conf:
+            json.dump(
+                {
+                    "board": random_board(size, 0.5).tolist(),
+                    "edge_mode": "wrap",
+                    "time_delay": 0,
+                    "generations": GENERATIONS,
+                },
+                conf,
+            )
+
+        seconds = _time_command(["--conf-file", conf_file, "--headless"], repeat)
+
+    results.append(
+        {
+            "benchmark": "startup_small_run",
+            "size": size,
+            "density": 0.5,
+            "mode": "wrap",
+            "seconds": seconds,
+            "cells_per_second": size * size * GENERATIONS / seconds,
+            "peak_bytes": None,
+        }
+    )
+
+    return results
+
+
+def _key(result: Dict) -> tuple:
+    return result["benchmark"], result["size"], result["density"], result["mode"]
+
+
+def compare(
+    results: List[Dict], baseline: List[Dict], tolerance: float = 0.2
+) -> List[str]:
+    """Compare results against a baseline.
+
+    Arguments
+    ---------
+    results: Results of the current run.
+    baseline: Results of a previous run. Combinations that are not in both
+    are ignored.
+    tolerance: Fraction of cells per second lost or peak memory gained
+    that is accepted.
+
+    Returns
+    -------
+    A message for each regression, empty if there are none.
+    """
+    baseline_results = {_key(result): result for result in baseline}
+
+    regressions = []
+    for result in results:
+        expected = baseline_results.get(_key(result))
+        if expected is None:
+            continue
+
+        description = "{} {}x{} density {} {}".format(
+            result["benchmark"],
+            result["size"],
+            result["size"],
+            result["density"],
+            result["mode"],
+        )
+        # The start up benchmarks only measure the time.
+        if result["cells_per_second"] is None:
+            slower = result["seconds"] > expected["seconds"] * (1 + tolerance)
+        else:
+            slower = result["cells_per_second"] < expected["cells_per_second"] * (
+                1 - tolerance
+            )
+        if slower:
+            regressions.append(
+                "{}: {:.3g} s, baseline {:.3g} s".format(
+                    description, result["seconds"], expected["seconds"]
+                )
+            )
+
+        if result["peak_bytes"] is not None:
+            if result["peak_bytes"] > expected["peak_bytes"] * (1 + tolerance):
+                regressions.append(
+                    "{}: {} peak bytes, baseline {} peak bytes".format(
+                        description, result["peak_bytes"], expected["peak_bytes"]
+                    )
+                )
+
+    return regressions
+
+
+def _print_result(result: Dict) -> None:
+    if result["cells_per_second"] is None:
+        throughput = "{:>20}".format("")
+    else:
+        throughput = "{:>12.4g} cells/s".format(result["cells_per_second"])
+    if result["peak_bytes"] is None:
+        memory = ""
+    else:
+        memory = "{:>14,} peak bytes".format(result["peak_bytes"])
+
+    print(
+        "{:<28} {:>5} {:>5.2f} {:<5} {:>10.4g} s {} {}".format(
+            result["benchmark"],
+            result["size"],
+            result["density"],
+            result["mode"],
+            result["seconds"],
+            throughput,
+            memory,
+        ),
+        flush=True,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Game of pyfe benchmark suite.")
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--densities", nargs="+", type=float, default=list(DENSITIES))
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="timed runs of each case."
+    )
+    parser.add_argument("--output", help="json file where the results are saved.")
+    parser.add_argument("--baseline", help="json file with the results to compare.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="fraction of speed lost or memory gained accepted against the baseline.",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="also measure the start up of the application.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        args.benchmarks,
+        args.sizes,
+        args.densities,
+        args.modes,
+        args.repeat,
+        report=_print_result,
+    )
+    if args.startup:
+        for result in run_startup(args.repeat):
+            _print_result(result)
+            results.append(result)
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+
+        for regression in regressions:
+            print("Regression: {}".format(regression))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+Command line interface of game of pyfe.
+
+Installed as the `game-of-pyfe` console script, and also run with
+`python -m game_of_pyfe`. Nothing is parsed at import time, and numpy and
+the engines are only imported once they are needed, so `--help` and small
+runs start fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import shutil
+import time
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .viewport import Viewport
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="game-of-pyfe", description="Game of pyfe application."
+    )
+    parser.add_argument(
+        "--conf-file",
+        type=argparse.FileType("r"),
+        default="./conf.json",
+        help="json configuration file containing the board and\
+                         edge behavior mode, generations number and time\
+                         delay between generations.",
+    )
+    parser.add_argument(
+        "--pattern-file",
+        default=None,
+        help="RLE (.rle), plaintext (.cells) or Life 1.06 (.lif, .life) file\
+                         with the initial board, used in place of the board\
+                         of the configuration file.",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the generations without printing the boards and report the\
+                         wall time and cells per second.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="file where the last board is written in headless mode, as .npy\
+                         or as a pattern file. Life 1.06 files keep the\
+                         board size in a #D size comment. With --every, the\
+                         path must contain {generation}.",
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        default=None,
+        help="write every k-th generation to --output instead of the last one.",
+    )
+    parser.add_argument(
+        "--stats",
+        default=None,
+        help="file where the population, births, deaths, bounding box and\
+                         timings of each generation are written as JSON lines.\
+                         Use - to print them in headless mode.",
+    )
+
+    return parser
+
+
+def print_boards(
+    boards: Iterable[np.array],
+    time_delay: float,
+    drop_frames: bool,
+    viewport: Viewport,
+) -> None:
+    """Print game of life boards.
+
+    The boards are computed in the background while they are printed, and
+    only the characters that changed since the previous board are redrawn.
+
+    Arguments
+    ---------
+    boards: Game of life boards, starting with generation 0.
+    time_delay: Time to wait between generations. In seconds.
+    drop_frames: Skip the boards computed while waiting the time delay.
+    viewport: Window of the boards printed.
+    """
+    from .pipeline import FramePipeline
+    from .render import TerminalRenderer
+
+    pipeline = FramePipeline(
+        boards, fps=1 / time_delay if time_delay > 0 else None, drop_frames=drop_frames
+    )
+
+    with TerminalRenderer(viewport=viewport) as renderer:
+        for generation, board in pipeline:
+            renderer.render(board, generation)
+
+
+def save_board(board: np.array, path: str) -> None:
+    """Write a board as .npy or, for other extensions, as a pattern file.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    path: Path to the file.
+    """
+    if path.endswith(".npy"):
+        import numpy as np
+
+        np.save(path, board)
+    else:
+        from .patterns import write_pattern
+
+        write_pattern(board, path)
+
+
+def run_headless(
+    board: np.array,
+    boards: Iterable[np.array],
+    output: Optional[str],
+    every: Optional[int],
+) -> None:
+    """Run the generations without printing them.
+
+    Arguments
+    ---------
+    board: Initial game of life board.
+    boards: Boards of each generation.
+    output: Path where the last board, or every k-th board, is written.
+    every: Write every k-th generation, formatting {generation} in output.
+    """
+    start = time.perf_counter()
+
+    generation = 0
+    last_board = board
+    for generation, last_board in enumerate(boards, 1):
+        if every is not None and generation % every == 0:
+            save_board(last_board, output.format(generation=generation))
+
+    if output is not None and every is None:
+        save_board(last_board, output)
+
+    wall_time = time.perf_counter() - start
+    print("Generations: {}".format(generation))
+    print("Wall time: {:.6f} s".format(wall_time))
+    print("Cells/sec: {:.4g}".format(board.size * generation / wall_time))
+
+
+def print_animation(
+    config_data: dict, board: np.array, boards: Iterable[np.array]
+) -> None:
+    """Print the boards in the terminal as configured.
+
+    Arguments
+    ---------
+    config_data: Configuration of the application.
+    board: Initial game of life board.
+    boards: Boards of each generation.
+    """
+    from .viewport import Viewport
+
+    # The generation line and the line below the board are not available.
+    terminal_size = shutil.get_terminal_size()
+    viewport = Viewport(
+        max(terminal_size.lines - 2, 1),
+        terminal_size.columns,
+        zoom=config_data.get("zoom", 1),
+        style=config_data.get("render_style", "block"),
+    )
+
+    print_boards(
+        itertools.chain([board], boards),
+        config_data["time_delay"],
+        config_data.get("drop_frames", False),
+        viewport,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the application.
+
+    Arguments
+    ---------
+    argv: Command line arguments, by default the ones of the process.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.every is not None and (args.output is None or args.every < 1):
+        parser.error("--every requires --output and a positive number")
+    if args.stats == "-" and not args.headless:
+        parser.error("--stats - requires --headless")
+
+    import numpy as np
+
+    from .core import evolve_board
+    from .utils import validate_board
+
+    with args.conf_file:
+        config_data = json.load(args.conf_file)
+    if args.pattern_file is not None:
+        from .patterns import read_pattern
+
+        board = read_pattern(args.pattern_file)
+    else:
+        board = np.array(config_data["board"])
+    edge_mode = config_data["edge_mode"]
+    generations = config_data["generations"]
+
+    board = validate_board(board)
+
+    stats_file = observer = None
+    if args.stats is not None:
+        from .instrumentation import JsonLinesWriter
+
+        if args.stats == "-":
+            observer = JsonLinesWriter()
+        else:
+            stats_file = open(args.stats, "w")
+            observer = JsonLinesWriter(stats_file)
+
+    # Cycles are only detected when a history of boards is configured.
+    cycle_detector = None
+    if config_data.get("cycle_history", 0) > 0:
+        from .cycles import CycleDetector
+
+        cycle_detector = CycleDetector(
+            config_data["cycle_history"], config_data.get("on_cycle", "replay")
+        )
+    board_evolver = evolve_board(
+        board,
+        generations,
+        edge_mode,
+        # Headless runs do not keep the boards, so no memory is allocated.
+        reuse_buffers=args.headless,
+        cycle_detector=cycle_detector,
+        rule=config_data.get("rule", "B3/S23"),
+        observer=observer,
+        backend=config_data.get("backend", "numpy"),
+    )
+
+    try:
+        if args.headless:
+            run_headless(board, board_evolver, args.output, args.every)
+        else:
+            print_animation(config_data, board, board_evolver)
+    finally:
+        if stats_file is not None:
+            stats_file.close()
+
+    if cycle_detector is not None and cycle_detector.period is not None:
+        print(
+            "Cycle of period {} detected starting at generation {}".format(
+                cycle_detector.period, cycle_detector.start
+            )
+        )
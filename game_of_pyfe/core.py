@@ -3,14 +3,233 @@
 
 The game of life is divided into obtaining the fields around each cell,
 updating each cell in a generation, obtaining a new board generation and
-evolving the board n generations.
+evolving the board n generations. Boards can also jump directly to a
+generation using HashLife.
+
+update_board and evolve_board can also compute the generations with other
+kernels, see game_of_pyfe.backends.
 """
 
-from typing import Literal, Tuple
+from functools import partial
+from typing import Callable, Literal, Tuple, Union
 
 import numpy as np
 from numpy.lib.stride_tricks import as_strided
 
+from .backends import get_backend, resolve_backend
+from .cycles import CycleDetector
+from .instrumentation import GenerationStats, Observer, PhaseTimer, observe_boards
+from .rules import ALIVE_OFFSET, CONWAY, Rule, parse_rule
+
+# Dtype of the cells of the boards. Bool boards are also kept as they are.
+CELL_DTYPE = np.uint8
+
+# Number of cells looked up at once in the rule table, which bounds the
+# size of the intp indices numpy creates for the lookup.
+_LOOKUP_CHUNK = 1 << 14
+
+
+def as_cells(board: np.array) -> np.array:
+    """Obtain the board with a one byte dtype.
+
+    Arguments
+    ---------
+    board: Game of life board.
+
+    Returns
+    -------
+    The board itself if it is already uint8 or bool, otherwise a uint8 copy.
+    """
+    if board.dtype == bool or board.dtype == CELL_DTYPE:
+        return board
+
+    return board.astype(CELL_DTYPE)
+
+
+def _pad_board(board: np.array, mode: Literal["wrap", "zeros"] = "wrap") -> np.array:
+    """Pad the last two axes of the board with one cell on each side.
+
+    Arguments
+    ---------
+    board: Game of life board (..., n, m).
+    mode: Edge behavior, "wrap" or "zeros".
+
+    Returns
+    -------
+    The padded board with shape (..., n + 2, m + 2).
+    """
+    pad_width = ((0, 0),) * (board.ndim - 2) + ((1, 1), (1, 1))
+
+    if mode == "zeros":
+        return np.pad(board, pad_width)
+    elif mode == "wrap":
+        return np.pad(board, pad_width, mode=mode)
+
+    raise TypeError("Mode not defined.")
+
+
+def _fill_halo(padded_board: np.array, mode: Literal["wrap", "zeros"]) -> None:
+    """Fill in place the one cell border of a padded board.
+
+    Arguments
+    ---------
+    padded_board: Padded game of life board (..., n + 2, m + 2) whose
+    inner (..., n, m) cells hold the board.
+    mode: Edge behavior, "wrap" or "zeros".
+    """
+    if mode == "wrap":
+        padded_board[..., 0, 1:-1] = padded_board[..., -2, 1:-1]
+        padded_board[..., -1, 1:-1] = padded_board[..., 1, 1:-1]
+        padded_board[..., :, 0] = padded_board[..., :, -2]
+        padded_board[..., :, -1] = padded_board[..., :, 1]
+    elif mode == "zeros":
+        padded_board[..., [0, -1], :] = 0
+        padded_board[..., :, [0, -1]] = 0
+    else:
+        raise TypeError("Mode not defined.")
+
+
+def _gather_window(
+    board: np.array,
+    top: int,
+    bottom: int,
+    left: int,
+    right: int,
+    mode: Literal["wrap", "zeros"],
+) -> np.array:
+    """Obtain a window of a board that can go past its edges.
+
+    The window has the rows [top, bottom) and columns [left, right). It is
+    used to obtain a part of a board with its halo, for example a strip of
+    rows with the row above and below it.
+
+    Arguments
+    ---------
+    board: Game of life board (n, m), also a memory-mapped array.
+    top, bottom, left, right: Limits of the rows and columns.
+    mode: Edge behavior. In "wrap" mode the cells past an edge are read
+    from the opposite edge of the board, and in "zeros" mode they are 0's.
+
+    Returns
+    -------
+    a new (bottom - top, right - left) array with a one byte dtype, see
+    as_cells.
+    """
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    n, m = board.shape
+    rows = np.arange(top, bottom)
+    columns = np.arange(left, right)
+
+    window = np.asarray(board.take(rows % n, axis=0))
+    if left != 0 or right != m:
+        window = window.take(columns % m, axis=1)
+    window = as_cells(window)
+
+    if mode == "zeros":
+        window[(rows < 0) | (rows >= n)] = 0
+        window[:, (columns < 0) | (columns >= m)] = 0
+
+    return window
+
+
+def _neighborhood_sum(padded_board: np.array, out: np.array = None) -> np.array:
+    """Sum every (3, 3) field of a padded board, center cell included.
+
+    The sum is done with nine shifted slices of the padded board instead
+    of one reduction per field.
+
+    Arguments
+    ---------
+    padded_board: Padded game of life board (..., n + 2, m + 2).
+    out: Optional array (..., n, m) where the sums are written.
+
+    Returns
+    -------
+    The field sums with shape (..., n, m).
+    """
+    if padded_board.dtype == bool:
+        padded_board = padded_board.view(np.uint8)
+
+    n = padded_board.shape[-2] - 2
+    m = padded_board.shape[-1] - 2
+
+    if out is None:
+        total = padded_board[..., 0:n, 0:m].copy()
+    else:
+        total = out
+        np.copyto(total, padded_board[..., 0:n, 0:m])
+
+    for i in range(3):
+        for j in range(3):
+            if i or j:
+                np.add(total, padded_board[..., i : i + n, j : j + m], out=total)
+
+    return total
+
+
+def _apply_rule(
+    board: np.array,
+    total: np.array,
+    rule: Rule = CONWAY,
+    out: np.array = None,
+    index: np.array = None,
+    stats: GenerationStats = None,
+) -> np.array:
+    """Apply a rule to a whole board at once with its lookup table.
+
+    The lookup is done in chunks of whole rows, so the optional statistics
+    are gathered from each chunk while it is still in the cache.
+
+    Arguments
+    ---------
+    board: Game of life board (..., n, m).
+    total: Field sums of the board, as given by _neighborhood_sum.
+    rule: Life-like rule.
+    out: Optional array (..., n, m) where the next generation is written.
+    When it is not C contiguous, the generation is computed in a temporary
+    array and copied into it.
+    index: Optional contiguous uint8 array (..., n, m) used to build the
+    table index.
+    stats: Optional GenerationStats of a (n, m) board where the counts of
+    the next generation are added.
+
+    Returns
+    -------
+    The next generation of the board with the same dtype as `board`.
+    """
+    if index is None:
+        index = np.empty(total.shape, dtype=np.uint8)
+    if out is None:
+        out = np.empty(total.shape, dtype=board.dtype)
+    # The lookup writes through a flat view of `out`, which reshape only
+    # gives for C contiguous arrays.
+    target = out
+    if not out.flags.c_contiguous:
+        out = np.empty(total.shape, dtype=out.dtype)
+
+    np.not_equal(board, 0, out=index)
+    np.multiply(index, ALIVE_OFFSET, out=index)
+    np.add(index, total, out=index, casting="unsafe")
+
+    table = rule.table.astype(board.dtype, copy=False)
+    flat_index = index.reshape(-1)
+    flat_out = out.reshape(-1)
+    m = index.shape[-1]
+    chunk = max(_LOOKUP_CHUNK // m, 1) * m
+
+    for start in range(0, flat_index.size, chunk):
+        stop = start + chunk
+        np.take(table, flat_index[start:stop], out=flat_out[start:stop], mode="clip")
+        if stats is not None:
+            stats.add(flat_index[start:stop], flat_out[start:stop], start // m)
+
+    if out is not target:
+        np.copyto(target, out)
+
+    return target
+
 
 def generate_fields(
     board: np.array, mode: Literal["wrap", "zeros"] = "wrap"
@@ -35,13 +254,7 @@ def generate_fields(
     board_shape = board.shape
     assert board_shape[0] >= 2 and board_shape[1] >= 2
 
-    if mode == "zeros":
-        padded_board = np.pad(board, (1, 1))
-    elif mode == "wrap":
-        padded_board = np.pad(board, (1, 1), mode=mode)
-
-    else:
-        raise TypeError("Mode not defined.")
+    padded_board = _pad_board(board, mode)
 
     return as_strided(
         padded_board,
@@ -50,9 +263,11 @@ def generate_fields(
     )
 
 
-def update_cell(field: np.array) -> int:
+def update_cell(field: np.array, rule: Union[str, Rule] = CONWAY) -> int:
     """Set the state of the cell life depending on the field sum.
 
+    With Conway's rule (B3/S23):
+
     1. If the field sums 3, cell is set to living.
     2. Else if the sums equals 4, cell state carries out the same.
     3. Every other results, sets the cell state to death.
@@ -60,6 +275,7 @@ def update_cell(field: np.array) -> int:
     Arguments
     ---------
     field: Neighborhood of cells of shape (3, 3).
+    rule: Life-like rule or its B/S notation.
 
     Returns
     -------
@@ -68,46 +284,194 @@ def update_cell(field: np.array) -> int:
     field_shape = field.shape
     assert field_shape[0] == 3 and field_shape[1] == 3
 
-    total = np.sum(field)
-    cell = 0
+    total = int(np.sum(field))
+    alive = int(field[1][1] != 0)
 
-    if total == 3:
-        cell = 1
-    elif total == 4:
-        cell = field[1][1]
+    return int(parse_rule(rule).table[total + ALIVE_OFFSET * alive])
 
-    return cell
+
+def _step(
+    board: np.array,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Rule = CONWAY,
+    out: np.array = None,
+) -> np.array:
+    """Step of the numpy backend, see game_of_pyfe.backends."""
+    total = _neighborhood_sum(_pad_board(board, mode))
+
+    return _apply_rule(board, total, rule, out=out)
 
 
-def update_board(board: np.array, mode: Literal["wrap", "zeros"] = "wrap") -> np.array:
+def update_board(
+    board: np.array,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+    backend: str = None,
+) -> np.array:
     """Move one generation in the game of life.
 
-    The operation is inmutable.
+    The operation is inmutable. The field sums of every cell are computed
+    at once and the update_cell rule is applied to the whole board.
 
     Arguments
     ---------
     board: Game of life board with shape (n, m) where
     n >= 2 and m >= 2
+    rule: Life-like rule or its B/S notation.
+    backend: Name of the backend computing the generation, by default the
+    default one, see game_of_pyfe.backends.
 
     Returns
     -------
-    new board in one generation older with shape (n, m)
+    new board in one generation older with shape (n, m) and a one byte
+    dtype, see as_cells.
     """
-    new_board = board.copy()
-    board_shape = new_board.shape
+    board_shape = board.shape
     assert board_shape[0] >= 2 and board_shape[1] >= 2
 
-    fields = generate_fields(new_board, mode)
+    board = as_cells(board)
 
-    for i in range(board_shape[0]):
-        for j in range(board_shape[1]):
-            new_board[i][j] = update_cell(fields[i][j])
+    return get_backend(backend)(board, mode, parse_rule(rule))
 
-    return new_board
+
+def _evolve_copies(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Rule = CONWAY,
+    timer: PhaseTimer = None,
+    stats: GenerationStats = None,
+) -> np.array:
+    """
+    Iterate through a board `n` generations, with a new board each time.
+
+    The timer and the statistics are given together, when observed.
+
+    Yields
+    ------
+    a new board with the state the current generation.
+    """
+    new_board = as_cells(board)
+    if timer is not None:
+        for _ in range(n_times):
+            timer.start()
+            stats.start()
+            total = _neighborhood_sum(_pad_board(new_board, mode))
+            timer.lap("pad")
+            new_board = _apply_rule(new_board, total, rule, stats=stats)
+            timer.lap("rule")
+            yield new_board
+        return
+
+    for _ in range(n_times):
+        new_board = _step(new_board, mode, rule)
+        yield new_board
+
+
+def _evolve_double_buffered(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Rule = CONWAY,
+    timer: PhaseTimer = None,
+    stats: GenerationStats = None,
+) -> np.array:
+    """
+    Iterate through a board `n` generations using two padded buffers.
+
+    Every array is allocated before the first generation, afterwards the
+    buffers swap their roles of current and next generation. The timer and
+    the statistics are given together, when observed.
+
+    Yields
+    ------
+    a read-only view of the buffer with the current generation.
+    """
+    board = as_cells(board)
+    board_shape = board.shape
+    buffers = [np.zeros((board_shape[0] + 2, board_shape[1] + 2), board.dtype)]
+    buffers.append(buffers[0].copy())
+    buffers[0][1:-1, 1:-1] = board
+
+    total = np.empty(board_shape, dtype=np.uint8)
+    index = np.empty(board_shape, dtype=np.uint8)
+    cells = np.empty(board_shape, dtype=board.dtype)
+
+    current, following = buffers
+    for _ in range(n_times):
+        if timer is not None:
+            timer.start()
+            stats.start()
+        _fill_halo(current, mode)
+        _neighborhood_sum(current, out=total)
+        if timer is not None:
+            timer.lap("pad")
+        _apply_rule(
+            current[1:-1, 1:-1], total, rule, out=cells, index=index, stats=stats
+        )
+        if timer is not None:
+            timer.lap("rule")
+
+        new_board = following[1:-1, 1:-1]
+        new_board[...] = cells
+        if timer is not None:
+            timer.lap("copy")
+
+        view = new_board.view()
+        view.flags.writeable = False
+        yield view
+
+        current, following = following, current
+
+
+def _evolve_backend(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Rule = CONWAY,
+    step: Callable = _step,
+    reuse_buffers: bool = False,
+) -> np.array:
+    """
+    Iterate through a board `n` generations with the step of a backend.
+
+    With reuse_buffers, the step writes each generation in one of two
+    boards that swap their roles of current and next generation.
+
+    Yields
+    ------
+    a new board, or a read-only view of the buffer, with the state the
+    current generation.
+    """
+    new_board = as_cells(board)
+    if not reuse_buffers:
+        for _ in range(n_times):
+            new_board = step(new_board, mode, rule)
+            yield new_board
+        return
+
+    current = np.array(new_board, order="C")
+    following = np.empty_like(current, order="C")
+    for _ in range(n_times):
+        step(current, mode, rule, out=following)
+
+        view = following.view()
+        view.flags.writeable = False
+        yield view
+
+        current, following = following, current
 
 
 def evolve_board(
-    board: np.array, n_times: int, mode: Literal["wrap", "zeros"] = "wrap"
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    workers: int = 1,
+    reuse_buffers: bool = False,
+    cycle_detector: CycleDetector = None,
+    rule: Union[str, Rule] = CONWAY,
+    observer: Observer = None,
+    backend: str = None,
 ) -> np.array:
     """
     Iterate through a board `n` generations.
@@ -116,15 +480,179 @@ def evolve_board(
     ---------
     board: Game of life board with shape (n, m) where
     n >= 2 and m >= 2
+    rule: Life-like rule or its B/S notation.
+    workers: Number of processes used to compute each generation. With
+    more than one, the board is split in strips of rows that are updated
+    in parallel, see game_of_pyfe.parallel.
+    reuse_buffers: If True, no memory is allocated after the first
+    generation and read-only views are yielded instead of new boards.
+    Each view is only valid until the next generation is requested.
+    cycle_detector: Optional CycleDetector that stops the evolution, or
+    replays the cycle, once a board repeats. The detected period and
+    start generation are left in the detector.
+    observer: Optional callable receiving the timings, population, births,
+    deaths and bounding box of each generation, see
+    game_of_pyfe.instrumentation. The counts are gathered while the rule is
+    applied, without another pass over the board, by the numpy backend.
+    backend: Name of the backend computing the generations, or the strips
+    of the workers, by default the default one, see game_of_pyfe.backends.
 
     Yields
     ------
-    a new board with the state the current generation.
+    a new board with the state the current generation, with a one byte
+    dtype, see as_cells.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+
+    board = as_cells(board)
+    rule = parse_rule(rule)
+    backend = resolve_backend(backend)
+    timer = stats = None
+
+    if workers > 1:
+        from .parallel import evolve_parallel_board
+
+        boards = evolve_parallel_board(
+            board, n_times, mode, workers, rule, reuse_buffers, backend
+        )
+    elif backend != "numpy":
+        boards = _evolve_backend(
+            board, n_times, mode, rule, get_backend(backend), reuse_buffers
+        )
+    else:
+        if observer is not None:
+            timer, stats = PhaseTimer(), GenerationStats(board_shape, rule)
+        if reuse_buffers:
+            boards = _evolve_double_buffered(board, n_times, mode, rule, timer, stats)
+        else:
+            boards = _evolve_copies(board, n_times, mode, rule, timer, stats)
+
+    if cycle_detector is not None:
+        step = partial(get_backend(backend), mode=mode, rule=rule)
+        boards = cycle_detector.watch(board, boards, n_times, step)
+
+    if observer is not None:
+        boards = observe_boards(board, boards, observer, timer, stats)
+
+    yield from boards
+
+
+def jump_board(
+    board: np.array,
+    generations: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    max_nodes: int = 2 ** 20,
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """Jump a board directly to a given generation using HashLife.
+
+    The board is advanced by the powers of two that sum the number of
+    generations, so only log2(generations) steps are done.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    generations: Number of generations to advance.
+    mode: Edge behavior, "wrap" or "zeros".
+    max_nodes: Maximum number of entries of the HashLife caches.
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    a new board with the state of the given generation, with a one byte
+    dtype, see as_cells.
     """
     board_shape = board.shape
     assert board_shape[0] >= 2 and board_shape[1] >= 2
+    assert generations >= 0
 
+    # HashLife is only imported when boards are jumped.
+    from .hashlife import HashLife
+
+    universe = HashLife(max_nodes, parse_rule(rule))
+    board = as_cells(board)
     new_board = board.copy()
-    for _ in range(n_times):
-        new_board = update_board(new_board, mode)
-        yield new_board
+    j = 0
+
+    while generations:
+        if generations & 1:
+            new_board = universe.step(new_board, j, mode).astype(board.dtype)
+        generations >>= 1
+        j += 1
+
+    return new_board
+
+
+def evolve_region(
+    board: np.array,
+    region: Tuple[int, int, int, int],
+    generations: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """Obtain a window of a board after a given number of generations.
+
+    A cell only depends on the cells at most k cells away k generations
+    before, so only the window grown by the number of generations on each
+    side is evolved, shrinking it by one cell on each side every
+    generation. The cost depends on the window and the generations instead
+    of the board, unless the grown window is bigger than the board, in
+    which case the whole board is evolved.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    region: The (top, left, height, width) of the window. In "wrap" mode
+    the window can go past the edges of the board and wraps around, and
+    in "zeros" mode its cells outside of the board are 0's.
+    generations: Number of generations to advance.
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    a new (height, width) window with the state of the given generation,
+    with a one byte dtype, see as_cells.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+    assert generations >= 0
+
+    top, left, height, width = region
+    assert height >= 1 and width >= 1
+
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    rule = parse_rule(rule)
+    board = as_cells(board)
+    n, m = board_shape
+    k = generations
+
+    if (height + 2 * k) * (width + 2 * k) >= board.size:
+        for board in evolve_board(
+            board, generations, mode, reuse_buffers=True, rule=rule
+        ):
+            pass
+        k = 0
+
+    window = _gather_window(
+        board, top - k, top + height + k, left - k, left + width + k, mode
+    )
+
+    if mode == "zeros":
+        # The cells outside of the board stay dead every generation.
+        rows = np.arange(top - k, top + height + k)
+        columns = np.arange(left - k, left + width + k)
+        inside = ((rows >= 0) & (rows < n))[:, None] & ((columns >= 0) & (columns < m))
+
+    for g in range(1, k + 1):
+        total = _neighborhood_sum(window)
+        window = _apply_rule(window[1:-1, 1:-1], total, rule)
+        if mode == "zeros":
+            window[~inside[g:-g, g:-g]] = 0
+
+    return window
@@ -0,0 +1,176 @@
+"""
+Cycle detection for game of life evolutions.
+
+Boards that settle into a still life or an oscillator repeat themselves
+forever. Only the digests of the recent boards are kept, so a repeated
+board is found without storing or comparing the recent boards. A repeated
+digest is confirmed by evolving the board one period, and once a cycle is
+known the following generations are replayed instead of computed.
+"""
+
+import hashlib
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Literal
+
+import numpy as np
+
+
+def hash_board(board: np.array) -> bytes:
+    """Obtain a short digest of the board shape, dtype and cells."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((board.shape, board.dtype.str)).encode())
+    if board.flags.c_contiguous:
+        digest.update(board.data)
+    else:
+        # Views of padded buffers are hashed by rows, without a copy.
+        for row in board.reshape(-1, board.shape[-1]):
+            digest.update(np.ascontiguousarray(row).data)
+
+    return digest.digest()
+
+
+class CycleDetector:
+    """Detect when an evolution repeats a board.
+
+    Only the digest and generation of the recent boards are kept. The
+    boards of the cycle are only kept once it is detected, to replay them.
+
+    Arguments
+    ---------
+    history: Number of recent boards whose digests are kept. Cycles with a
+    longer period are not detected.
+    on_cycle: What to do once a cycle is detected. "stop" ends the
+    evolution and "replay" yields the remaining generations from the
+    boards of the cycle without computing them.
+
+    Attributes
+    ----------
+    period: Period of the detected cycle, 1 for still lifes. None if no
+    cycle was detected.
+    start: First generation of the detected cycle. None if no cycle was
+    detected.
+    """
+
+    def __init__(self, history: int = 64, on_cycle: Literal["stop", "replay"] = "stop"):
+        assert history >= 1
+
+        if on_cycle not in ("stop", "replay"):
+            raise TypeError("Cycle behavior not defined.")
+
+        self.history = history
+        self.on_cycle = on_cycle
+        self.period = None
+        self.start = None
+        self._keys = deque()
+        self._generations: Dict[bytes, List[int]] = {}
+        self._cycle: List[np.array] = []
+
+    def _confirm(
+        self, board: np.array, period: int, step: Callable[[np.array], np.array]
+    ) -> bool:
+        """Check that a board returns to itself after evolving one period.
+
+        This rules out hash collisions. The boards of the cycle are kept
+        when they are replayed.
+        """
+        replay = self.on_cycle == "replay"
+        # The board may be a buffer that the evolution overwrites.
+        cycle = [board.copy()] if replay else []
+
+        new_board = board
+        for _ in range(period):
+            new_board = step(new_board)
+            if replay:
+                cycle.append(new_board)
+
+        if not np.array_equal(new_board, board):
+            return False
+
+        # The last board is the first one again.
+        self._cycle = cycle[:-1]
+        return True
+
+    def check(
+        self, board: np.array, generation: int, step: Callable[[np.array], np.array]
+    ) -> bool:
+        """Record the digest of a board and check if it repeats.
+
+        Arguments
+        ---------
+        board: Game of life board.
+        generation: Generation of the board.
+        step: Function returning the next generation of a board, used to
+        confirm the cycle.
+
+        Returns
+        -------
+        True if the board is equal to one of the recent boards.
+        """
+        key = hash_board(board)
+
+        for previous in self._generations.get(key, []):
+            if self._confirm(board, generation - previous, step):
+                self.period = generation - previous
+                self.start = previous
+                return True
+
+        self._keys.append(key)
+        self._generations.setdefault(key, []).append(generation)
+
+        if len(self._keys) > self.history:
+            generations = self._generations[self._keys[0]]
+            generations.pop(0)
+            if not generations:
+                del self._generations[self._keys[0]]
+            self._keys.popleft()
+
+        return False
+
+    def cycle(self) -> List[np.array]:
+        """Obtain the boards of the detected cycle, from its start.
+
+        The boards are only kept when the cycle is replayed.
+        """
+        assert self.period is not None and self.on_cycle == "replay"
+
+        return self._cycle
+
+    def watch(
+        self,
+        board: np.array,
+        boards: Iterator[np.array],
+        n_times: int,
+        step: Callable[[np.array], np.array],
+    ) -> Iterator[np.array]:
+        """
+        Iterate through an evolution until a cycle is detected.
+
+        Arguments
+        ---------
+        board: Initial game of life board.
+        boards: Iterator of the following `n` generations of the board.
+        n_times: Number of generations of the evolution.
+        step: Function returning the next generation of a board.
+
+        Yields
+        ------
+        the boards of the evolution. Once a cycle is detected, the
+        evolution stops or the cycle is replayed until `n` generations.
+        """
+        self.check(board, 0, step)
+
+        generation = 0
+        for generation, new_board in enumerate(boards, 1):
+            yield new_board
+            if self.check(new_board, generation, step):
+                break
+        else:
+            return
+
+        if hasattr(boards, "close"):
+            boards.close()
+
+        if self.on_cycle == "replay":
+            cycle = self.cycle()
+            for future in range(generation + 1, n_times + 1):
+                yield cycle[(future - self.start) % self.period].copy()
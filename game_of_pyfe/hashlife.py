@@ -0,0 +1,284 @@
+"""
+HashLife implementation of the game of life.
+
+The board is stored as a quadtree where equal sub-squares are the same
+node, and the evolution of every node is memoized. A node of level k
+(a square of 2^k cells) knows how its center square of level k - 1 looks
+2^j generations later for any j <= k - 2, which allows to jump ahead a
+huge number of generations of regular patterns.
+
+The quadtree works on an infinite plane, so the edge modes are built into
+it. In "wrap" mode the plane is tiled with copies of the board and in
+"zeros" mode the board is surrounded by wall cells, that are always dead
+and never change.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Literal, Tuple
+
+import numpy as np
+
+from .rules import ALIVE_OFFSET, CONWAY, Rule
+
+DEAD = 0
+ALIVE = 1
+WALL = 2
+
+
+class _Node:
+    """Quadtree node, with the a, b, c, d children at NW, NE, SW, SE."""
+
+    __slots__ = ("k", "a", "b", "c", "d", "state")
+
+    def __init__(self, k, a=None, b=None, c=None, d=None, state=DEAD):
+        self.k = k
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.state = state
+
+
+class HashLife:
+    """HashLife universe with bounded caches.
+
+    Arguments
+    ---------
+    max_nodes: Maximum number of entries kept in each of the node and
+    result caches. The least recently used results are evicted first and
+    the node cache is dropped when it is full, which only reduces the
+    sharing between nodes.
+    rule: Life-like rule of the universe.
+    """
+
+    def __init__(self, max_nodes: int = 2 ** 20, rule: Rule = CONWAY):
+        assert max_nodes > 0
+
+        self.max_nodes = max_nodes
+        self.rule = rule
+        self._table = rule.table.tolist()
+        self._leaves = tuple(_Node(0, state=state) for state in (DEAD, ALIVE, WALL))
+        self._nodes = {}
+        self._results = OrderedDict()
+        self._uniform = {}
+
+    def join(self, a: _Node, b: _Node, c: _Node, d: _Node) -> _Node:
+        """Obtain the node made of the a, b, c, d quadrants."""
+        key = (a, b, c, d)
+        node = self._nodes.get(key)
+
+        if node is None:
+            if len(self._nodes) >= self.max_nodes:
+                self._nodes.clear()
+            node = _Node(a.k + 1, a, b, c, d)
+            self._nodes[key] = node
+
+        return node
+
+    def uniform(self, state: int, k: int) -> _Node:
+        """Obtain the level k node filled with a single state."""
+        node = self._uniform.get((state, k))
+
+        if node is None:
+            if k == 0:
+                node = self._leaves[state]
+            else:
+                child = self.uniform(state, k - 1)
+                node = self.join(child, child, child, child)
+            self._uniform[(state, k)] = node
+
+        return node
+
+    def _base_successor(self, node: _Node) -> _Node:
+        """Advance the center (2, 2) square of a level 2 node one generation."""
+        a, b, c, d = node.a, node.b, node.c, node.d
+        grid = (
+            (a.a.state, a.b.state, b.a.state, b.b.state),
+            (a.c.state, a.d.state, b.c.state, b.d.state),
+            (c.a.state, c.b.state, d.a.state, d.b.state),
+            (c.c.state, c.d.state, d.c.state, d.d.state),
+        )
+
+        cells = []
+        for i in (1, 2):
+            for j in (1, 2):
+                state = grid[i][j]
+                if state != WALL:
+                    total = sum(
+                        grid[y][x] == ALIVE
+                        for y in (i - 1, i, i + 1)
+                        for x in (j - 1, j, j + 1)
+                    )
+                    if state == ALIVE:
+                        total += ALIVE_OFFSET
+                    state = ALIVE if self._table[total] else DEAD
+                cells.append(self._leaves[state])
+
+        return self.join(*cells)
+
+    def successor(self, node: _Node, j: int) -> _Node:
+        """Advance the center of a node 2^j generations.
+
+        Arguments
+        ---------
+        node: Node of level k >= 2.
+        j: Exponent of the number of generations, where j <= k - 2.
+
+        Returns
+        -------
+        The level k - 1 center square of the node 2^j generations later.
+        """
+        assert node.k >= 2 and j <= node.k - 2
+
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if node.k == 2:
+            result = self._base_successor(node)
+        else:
+            a, b, c, d = node.a, node.b, node.c, node.d
+            join = self.join
+
+            # Nine overlapping sub-squares of level k - 1, advanced by
+            # up to half of the generations.
+            half = j if j < node.k - 2 else j - 1
+            c1 = self.successor(a, half)
+            c2 = self.successor(join(a.b, b.a, a.d, b.c), half)
+            c3 = self.successor(b, half)
+            c4 = self.successor(join(a.c, a.d, c.a, c.b), half)
+            c5 = self.successor(join(a.d, b.c, c.b, d.a), half)
+            c6 = self.successor(join(b.c, b.d, d.a, d.b), half)
+            c7 = self.successor(c, half)
+            c8 = self.successor(join(c.b, d.a, c.d, d.c), half)
+            c9 = self.successor(d, half)
+
+            if j < node.k - 2:
+                result = join(
+                    join(c1.d, c2.c, c4.b, c5.a),
+                    join(c2.d, c3.c, c5.b, c6.a),
+                    join(c4.d, c5.c, c7.b, c8.a),
+                    join(c5.d, c6.c, c8.b, c9.a),
+                )
+            else:
+                result = join(
+                    self.successor(join(c1, c2, c4, c5), half),
+                    self.successor(join(c2, c3, c5, c6), half),
+                    self.successor(join(c4, c5, c7, c8), half),
+                    self.successor(join(c5, c6, c8, c9), half),
+                )
+
+        self._results[key] = result
+        if len(self._results) > self.max_nodes:
+            self._results.popitem(last=False)
+
+        return result
+
+    def from_board(
+        self, board: np.array, k: int, offset: int, mode: Literal["wrap", "zeros"]
+    ) -> _Node:
+        """Build the level k node whose top left cell is at (-offset, -offset).
+
+        The board lays at (0, 0). In "wrap" mode the rest of the plane is
+        filled with copies of the board and in "zeros" mode with walls.
+        """
+        n, m = board.shape
+        memo = {}
+
+        def build(level: int, y: int, x: int) -> _Node:
+            size = 1 << level
+
+            if mode == "wrap":
+                key = (level, y % n, x % m)
+            else:
+                if y >= n or x >= m or y + size <= 0 or x + size <= 0:
+                    return self.uniform(WALL, level)
+                inside = y >= 0 and x >= 0 and y + size <= n and x + size <= m
+                if inside and not board[y : y + size, x : x + size].any():
+                    return self.uniform(DEAD, level)
+                key = (level, y, x)
+
+            node = memo.get(key)
+            if node is None:
+                if level == 0:
+                    node = self._leaves[ALIVE if board[y % n, x % m] else DEAD]
+                else:
+                    half = size >> 1
+                    node = self.join(
+                        build(level - 1, y, x),
+                        build(level - 1, y, x + half),
+                        build(level - 1, y + half, x),
+                        build(level - 1, y + half, x + half),
+                    )
+                memo[key] = node
+
+            return node
+
+        return build(k, -offset, -offset)
+
+    def to_board(self, node: _Node, shape: Tuple[int, int]) -> np.array:
+        """Extract the (n, m) window at the top left corner of a node."""
+        n, m = shape
+        board = np.zeros(shape, dtype=np.uint8)
+        blocks: Dict[_Node, np.array] = {}
+
+        def block(node: _Node) -> np.array:
+            cells = blocks.get(node)
+            if cells is None:
+                if node.k == 0:
+                    cells = np.array([[node.state == ALIVE]], dtype=np.uint8)
+                else:
+                    cells = np.block(
+                        [[block(node.a), block(node.b)], [block(node.c), block(node.d)]]
+                    )
+                blocks[node] = cells
+
+            return cells
+
+        def extract(node: _Node, y: int, x: int) -> None:
+            size = 1 << node.k
+            if y >= n or x >= m or node is self.uniform(DEAD, node.k):
+                return
+
+            if size <= max(n, m):
+                cells = block(node)
+                board[y : y + size, x : x + size] = cells[: n - y, : m - x]
+                return
+
+            half = size >> 1
+            extract(node.a, y, x)
+            extract(node.b, y, x + half)
+            extract(node.c, y + half, x)
+            extract(node.d, y + half, x + half)
+
+        extract(node, 0, 0)
+
+        return board
+
+    def step(
+        self, board: np.array, j: int, mode: Literal["wrap", "zeros"] = "wrap"
+    ) -> np.array:
+        """Advance a board 2^j generations.
+
+        Arguments
+        ---------
+        board: Game of life board with shape (n, m).
+        j: Exponent of the number of generations.
+        mode: Edge behavior, "wrap" or "zeros".
+
+        Returns
+        -------
+        The board 2^j generations older, as a uint8 array.
+        """
+        if mode not in ("wrap", "zeros"):
+            raise TypeError("Mode not defined.")
+
+        # The center of the node must cover the board.
+        k = max(j + 2, int(max(board.shape) - 1).bit_length() + 1, 2)
+        offset = 1 << (k - 2)
+
+        root = self.from_board(board, k, offset, mode)
+
+        return self.to_board(self.successor(root, j), board.shape)
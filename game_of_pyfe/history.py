@@ -0,0 +1,246 @@
+"""
+Evolution history files for game of pyfe.
+
+A history file stores every generation of a run. Every `keyframe_interval`
+generations the whole board is stored, and the generations in between
+only store the cells that changed, as the XOR with the previous board.
+Both are bit packed and compressed with zlib, so long runs take a small
+fraction of the raw boards.
+
+The file layout is:
+
+1. A header with the magic bytes, the format version, the board shape and
+   the keyframe interval.
+2. The compressed frames, one per generation.
+3. An index with the offset of each frame, followed by a footer with the
+   offset of the index and the number of frames.
+
+The index allows to decode any generation starting from the nearest
+keyframe, without reading the rest of the file.
+"""
+
+import struct
+import zlib
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"PYFEHIST"
+VERSION = 1
+
+# Magic, version, rows, columns and keyframe interval.
+_HEADER = struct.Struct("<8sBIII")
+# Offset of the index and number of frames.
+_FOOTER = struct.Struct("<QQ")
+_OFFSET_DTYPE = np.dtype("<u8")
+
+
+def _pack(board: np.array) -> np.array:
+    """Pack the cells of a board into a flat array of bits."""
+    return np.packbits(board != 0)
+
+
+class HistoryWriter:
+    """Writer of history files.
+
+    The boards are appended one generation at a time, and the index is
+    written when the writer is closed. It can be used as a context manager.
+
+    Arguments
+    ---------
+    path: Path to the history file.
+    keyframe_interval: Number of generations between whole boards.
+    level: zlib compression level.
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = 64, level: int = 6):
+        assert keyframe_interval >= 1
+
+        self.keyframe_interval = keyframe_interval
+        self.level = level
+        self.shape: Optional[Tuple[int, int]] = None
+
+        self._file: BinaryIO = open(path, "wb")
+        self._offsets = []
+        self._previous: Optional[np.array] = None
+
+    def append(self, board: np.array) -> None:
+        """Append the next generation.
+
+        Arguments
+        ---------
+        board: Game of life board.
+
+        Raises
+        ------
+        ValueError if the board shape is not the shape of the first board.
+        """
+        if self.shape is None:
+            self.shape = board.shape
+            self._file.write(
+                _HEADER.pack(MAGIC, VERSION, *board.shape, self.keyframe_interval)
+            )
+        elif board.shape != self.shape:
+            raise ValueError(
+                "Board shape {} is not the history shape {}".format(
+                    board.shape, self.shape
+                )
+            )
+
+        packed = _pack(board)
+        if len(self) % self.keyframe_interval == 0:
+            frame = packed
+        else:
+            frame = packed ^ self._previous
+
+        self._offsets.append(self._file.tell())
+        self._file.write(zlib.compress(frame.tobytes(), self.level))
+        self._previous = packed
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def close(self) -> None:
+        """Write the index and close the file."""
+        if self._file.closed:
+            return
+
+        if self.shape is None:
+            self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0, self.keyframe_interval))
+
+        index_offset = self._file.tell()
+        self._file.write(np.array(self._offsets, dtype=_OFFSET_DTYPE).tobytes())
+        self._file.write(_FOOTER.pack(index_offset, len(self._offsets)))
+        self._file.close()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class HistoryReader:
+    """Reader of history files with random access to the generations.
+
+    The last decoded generation is kept, so reading the generations in
+    order only decodes one frame each. It can be used as a context manager.
+
+    Arguments
+    ---------
+    path: Path to the history file.
+
+    Raises
+    ------
+    ValueError if the file is not a history file.
+    """
+
+    def __init__(self, path: str):
+        self._file: BinaryIO = open(path, "rb")
+
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[: len(MAGIC)] != MAGIC:
+            self._file.close()
+            raise ValueError("{} is not a history file".format(path))
+
+        _, version, n, m, self.keyframe_interval = _HEADER.unpack(header)
+        if version != VERSION:
+            self._file.close()
+            raise ValueError("History file version {} not supported".format(version))
+        self.shape = (n, m)
+
+        self._file.seek(-_FOOTER.size, 2)
+        index_offset, n_frames = _FOOTER.unpack(self._file.read(_FOOTER.size))
+
+        self._file.seek(index_offset)
+        self._offsets = np.frombuffer(
+            self._file.read(n_frames * _OFFSET_DTYPE.itemsize), dtype=_OFFSET_DTYPE
+        ).tolist()
+        # The end of each frame is the start of the next one.
+        self._ends = self._offsets[1:] + [index_offset]
+
+        self._generation: Optional[int] = None
+        self._packed: Optional[np.array] = None
+
+    def _read_frame(self, generation: int) -> np.array:
+        """Read and decompress the packed frame of a generation."""
+        start, end = self._offsets[generation], self._ends[generation]
+        self._file.seek(start)
+
+        return np.frombuffer(
+            zlib.decompress(self._file.read(end - start)), dtype=np.uint8
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, generation: int) -> np.array:
+        """Decode a generation.
+
+        Arguments
+        ---------
+        generation: Index of the generation, negative values count from the
+        last generation.
+
+        Raises
+        ------
+        IndexError if the generation is not in the history.
+
+        Returns
+        -------
+        The uint8 board of the generation.
+        """
+        if generation < 0:
+            generation += len(self)
+        if not 0 <= generation < len(self):
+            raise IndexError("Generation {} not in the history".format(generation))
+
+        keyframe = generation - generation % self.keyframe_interval
+        if self._generation is not None and keyframe <= self._generation <= generation:
+            packed, start = self._packed, self._generation + 1
+        else:
+            packed, start = self._read_frame(keyframe), keyframe + 1
+
+        for delta in range(start, generation + 1):
+            packed = packed ^ self._read_frame(delta)
+
+        self._generation, self._packed = generation, packed
+
+        n, m = self.shape
+        return np.unpackbits(packed, count=n * m).reshape(n, m)
+
+    def __iter__(self) -> Iterator[np.array]:
+        for generation in range(len(self)):
+            yield self[generation]
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "HistoryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_history(
+    path: str, boards: Iterable[np.array], keyframe_interval: int = 64
+) -> int:
+    """Write all the boards of a run to a history file.
+
+    Arguments
+    ---------
+    path: Path to the history file.
+    boards: Boards of each generation, for example from evolve_board.
+    keyframe_interval: Number of generations between whole boards.
+
+    Returns
+    -------
+    The number of generations written.
+    """
+    with HistoryWriter(path, keyframe_interval) as writer:
+        for board in boards:
+            writer.append(board)
+
+    return len(writer)
@@ -0,0 +1,258 @@
+"""
+Instrumentation of game of pyfe evolutions.
+
+An observer is any callable receiving the metrics of each generation
+yielded by evolve_board, as a dict with the keys:
+
+1. generation: Number of the generation, counting from 1.
+2. seconds: Time taken to obtain the generation.
+3. pad_seconds, rule_seconds and copy_seconds: Time spent padding the
+   board and summing the fields, applying the rule and copying the new
+   board. They are None when the engine does not split its work, like
+   the parallel one or the backends other than numpy, and 0 for replayed
+   cycles.
+4. population: Number of living cells.
+5. births and deaths: Number of cells that became alive or dead.
+6. bounding_box: The [top, left, bottom, right] rows and columns, both
+   included, of the living cells, or None without living cells.
+7. cells_per_second: Cells of the board divided by seconds.
+
+The population, births, deaths and bounding box are gathered by the
+engines while the rule is applied (see GenerationStats), and only
+counted from the boards for engines that do not gather them.
+
+Without an observer evolve_board does not measure anything.
+"""
+
+import json
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .rules import ALIVE_OFFSET, Rule
+
+PHASES = ("pad", "rule", "copy")
+
+Observer = Callable[[Dict], None]
+
+
+class PhaseTimer:
+    """Accumulate the time spent in each phase of a generation."""
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def start(self) -> None:
+        """Start measuring the first phase."""
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Add the time since the last lap, or start, to a phase."""
+        now = time.perf_counter()
+        self.seconds[phase] += now - self._last
+        self._last = now
+
+    def reset(self) -> Dict[str, float]:
+        """Obtain the accumulated seconds of each phase and start again."""
+        seconds = self.seconds
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+
+        return seconds
+
+
+def _bounding_box(rows: np.array, columns: np.array) -> Optional[List[int]]:
+    """Obtain the [top, left, bottom, right] box of the living cells."""
+    row_index = np.flatnonzero(rows)
+    if len(row_index) == 0:
+        return None
+    column_index = np.flatnonzero(columns)
+
+    return [
+        int(row_index[0]),
+        int(column_index[0]),
+        int(row_index[-1]),
+        int(column_index[-1]),
+    ]
+
+
+class GenerationStats:
+    """Statistics of a generation, gathered while the rule is applied.
+
+    Each chunk of the rule lookup adds the histogram of its table indices,
+    which together with the rule gives the population, births and deaths,
+    and marks its living rows and columns for the bounding box.
+
+    Arguments
+    ---------
+    shape: Shape (n, m) of the board.
+    rule: Rule applied to the board.
+
+    Attributes
+    ----------
+    ready: True when the statistics of a new generation were gathered and
+    not yet read.
+    """
+
+    def __init__(self, shape: Tuple[int, int], rule: Rule):
+        self._alive = rule.table == 1
+        self._counts = np.zeros(2 * ALIVE_OFFSET, dtype=np.int64)
+        self._rows = np.zeros(shape[0], dtype=bool)
+        self._columns = np.zeros(shape[1], dtype=bool)
+        self.ready = False
+
+    def start(self) -> None:
+        """Start gathering a new generation."""
+        self._counts[...] = 0
+        self._rows[...] = False
+        self._columns[...] = False
+        self.ready = True
+
+    def add(self, index: np.array, cells: np.array, first_row: int) -> None:
+        """Add a chunk of whole rows of the board.
+
+        Arguments
+        ---------
+        index: Flat table indices of the chunk.
+        cells: Flat next generation of the chunk.
+        first_row: Row of the board where the chunk starts.
+        """
+        self._counts += np.bincount(index, minlength=2 * ALIVE_OFFSET)
+
+        rows = cells.reshape(-1, len(self._columns)) != 0
+        self._rows[first_row : first_row + len(rows)] = rows.any(axis=1)
+        self._columns |= rows.any(axis=0)
+
+    def read(self) -> Dict:
+        """Obtain the statistics of the generation.
+
+        Returns
+        -------
+        A dict with the population, births, deaths and bounding_box keys.
+        """
+        self.ready = False
+        dead, living = self._counts[:ALIVE_OFFSET], self._counts[ALIVE_OFFSET:]
+
+        return {
+            "population": int(self._counts[self._alive].sum()),
+            "births": int(dead[self._alive[:ALIVE_OFFSET]].sum()),
+            "deaths": int(living[~self._alive[ALIVE_OFFSET:]].sum()),
+            "bounding_box": _bounding_box(self._rows, self._columns),
+        }
+
+
+def board_stats(previous: np.array, board: np.array) -> Dict:
+    """Count the statistics of a generation from its boards.
+
+    Arguments
+    ---------
+    previous: Board of the previous generation.
+    board: Board of the generation.
+
+    Returns
+    -------
+    A dict with the population, births, deaths and bounding_box keys.
+    """
+    previous, alive = previous != 0, board != 0
+
+    return {
+        "population": int(np.count_nonzero(alive)),
+        "births": int(np.count_nonzero(alive & ~previous)),
+        "deaths": int(np.count_nonzero(previous & ~alive)),
+        "bounding_box": _bounding_box(alive.any(axis=1), alive.any(axis=0)),
+    }
+
+
+def observe_boards(
+    board: np.array,
+    boards: Iterable[np.array],
+    observer: Observer,
+    timer: Optional[PhaseTimer] = None,
+    stats: Optional[GenerationStats] = None,
+) -> Iterator[np.array]:
+    """Report the metrics of each generation to an observer.
+
+    Arguments
+    ---------
+    board: Initial board.
+    boards: Boards of each generation.
+    observer: Called with the metrics of each generation before it is
+    yielded.
+    timer: Timer of the phases, filled by the engine yielding the boards.
+    stats: Statistics gathered by the engine yielding the boards. The
+    generations it does not gather, like replayed cycles, are counted from
+    the boards.
+
+    Yields
+    ------
+    the boards of each generation, unchanged.
+    """
+    # Only a reference is kept, the previous board is read when the engine
+    # does not gather the statistics. A reused buffer is still valid then,
+    # since the engine did not compute another generation.
+    previous = board
+    iterator = iter(boards)
+    generation = 0
+
+    while True:
+        start = time.perf_counter()
+        try:
+            new_board = next(iterator)
+        except StopIteration:
+            return
+        seconds = time.perf_counter() - start
+        generation += 1
+
+        metrics = {"generation": generation, "seconds": seconds}
+        if timer is not None:
+            for phase, phase_seconds in timer.reset().items():
+                metrics["{}_seconds".format(phase)] = phase_seconds
+        else:
+            metrics.update(
+                dict.fromkeys("{}_seconds".format(phase) for phase in PHASES)
+            )
+        if stats is not None and stats.ready:
+            metrics.update(stats.read())
+        else:
+            metrics.update(board_stats(previous, new_board))
+        metrics["cells_per_second"] = new_board.size / seconds if seconds > 0 else None
+
+        observer(metrics)
+        previous = new_board
+
+        yield new_board
+
+
+class MetricsRecorder:
+    """Observer that keeps the metrics of every generation.
+
+    Attributes
+    ----------
+    metrics: Metrics of each generation, in order.
+    """
+
+    def __init__(self):
+        self.metrics: List[Dict] = []
+
+    def __call__(self, metrics: Dict) -> None:
+        self.metrics.append(metrics)
+
+
+class JsonLinesWriter:
+    """Observer that writes the metrics of each generation as a JSON line.
+
+    The metrics can be followed while the board evolves.
+
+    Arguments
+    ---------
+    stream: Text stream where the metrics are written.
+    """
+
+    def __init__(self, stream: TextIO = None):
+        self.stream = sys.stdout if stream is None else stream
+
+    def __call__(self, metrics: Dict) -> None:
+        self.stream.write(json.dumps(metrics) + "\n")
+        self.stream.flush()
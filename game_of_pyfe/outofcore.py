@@ -0,0 +1,139 @@
+"""
+Out-of-core game of life implementation.
+
+Boards are read from and written to memory-mapped .npy files, and each
+generation is computed in bands of rows. Only a band together with the
+row above and below it is loaded in memory at a time, so boards larger
+than the memory can be evolved.
+"""
+
+import os
+import tempfile
+from typing import Literal, Union
+
+import numpy as np
+
+from .core import CELL_DTYPE, _apply_rule, _gather_window, _neighborhood_sum
+from .rules import CONWAY, Rule, parse_rule
+
+
+def update_board_file(
+    source: np.array,
+    destination: np.array,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+    band_rows: int = 1024,
+) -> None:
+    """Move a board one generation, band by band.
+
+    Arguments
+    ---------
+    source: Game of life board with shape (n, m) where n >= 2 and m >= 2,
+    usually a memory-mapped array.
+    destination: Array with the same shape where the new board is written.
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation.
+    band_rows: Number of rows computed at once.
+    """
+    board_shape = source.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+    assert destination.shape == board_shape
+    assert band_rows >= 1
+
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    rule = parse_rule(rule)
+
+    for start in range(0, board_shape[0], band_rows):
+        stop = min(start + band_rows, board_shape[0])
+
+        # Only the band and the rows above and below it are read.
+        padded_band = _gather_window(
+            source, start - 1, stop + 1, -1, board_shape[1] + 1, mode
+        )
+
+        total = _neighborhood_sum(padded_band)
+        destination[start:stop] = _apply_rule(padded_band[1:-1, 1:-1], total, rule)
+
+
+def _temporary_npy(path: str) -> str:
+    """Create an empty temporary .npy file in the directory of a path."""
+    handle, temporary = tempfile.mkstemp(
+        suffix=".npy", dir=os.path.dirname(os.path.abspath(path))
+    )
+    os.close(handle)
+
+    return temporary
+
+
+def evolve_npy_file(
+    source: str,
+    destination: str,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+    band_rows: int = 1024,
+) -> None:
+    """Evolve a board stored in a .npy file `n` generations.
+
+    The intermediate generations are kept in a temporary file next to the
+    destination, so at most two boards are stored on disk and only a band
+    of rows is in memory. The destination can be the source, which is
+    replaced by the last generation at the end.
+
+    Arguments
+    ---------
+    source: Path to the .npy file with the game of life board with shape
+    (n, m) where n >= 2 and m >= 2
+    destination: Path to the .npy file where the last generation is
+    written with uint8 cells.
+    n_times: Number of generations.
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation.
+    band_rows: Number of rows computed at once.
+    """
+    board = np.load(source, mmap_mode="r")
+    board_shape = board.shape
+    assert len(board_shape) == 2
+
+    # Opening the destination would truncate a source evolved in place
+    # while it is still read, so the result is written to a temporary file
+    # that replaces the source at the end.
+    in_place = os.path.exists(destination) and os.path.samefile(source, destination)
+    output = _temporary_npy(destination) if in_place else destination
+    temporary = None
+    try:
+        result = np.lib.format.open_memmap(
+            output, mode="w+", dtype=CELL_DTYPE, shape=board_shape
+        )
+        if n_times == 0:
+            for start in range(0, board_shape[0], band_rows):
+                result[start : start + band_rows] = board[start : start + band_rows]
+            result.flush()
+        else:
+            temporary = _temporary_npy(destination)
+            buffers = [
+                result,
+                np.lib.format.open_memmap(
+                    temporary, mode="w+", dtype=CELL_DTYPE, shape=board_shape
+                ),
+            ]
+
+            # The buffers alternate so the last generation lands in the result.
+            for generation in range(1, n_times + 1):
+                new_board = buffers[(n_times - generation) % 2]
+                update_board_file(board, new_board, mode, rule, band_rows)
+                new_board.flush()
+                board = new_board
+
+            del new_board, buffers
+        del board, result
+
+        if in_place:
+            os.replace(output, destination)
+    finally:
+        if temporary is not None:
+            os.remove(temporary)
+        if in_place and os.path.exists(output):
+            os.remove(output)
@@ -0,0 +1,234 @@
+"""
+Bit-packed game of life implementation.
+
+Each row of the board is stored in uint64 words holding 64 cells each.
+Cell j of a row lives in bit j % 64 of word j // 64. The neighbor counts
+are computed with bitwise adders working on the 64 cells of a word at the
+same time (SWAR), so no cell is ever visited individually.
+"""
+
+from typing import Literal, Tuple, Union
+
+import numpy as np
+
+from .rules import CONWAY, Rule, parse_rule
+
+WORD_BITS = 64
+_WORD_DTYPE = np.dtype("<u8")
+_ONE = np.uint64(1)
+_TOP = np.uint64(WORD_BITS - 1)
+
+
+def pack_board(board: np.array) -> np.array:
+    """Pack a game of life board into uint64 words.
+
+    Arguments
+    ---------
+    board: Game of life board (n, m) of 0's and 1's.
+
+    Returns
+    -------
+    The packed board with shape (n, ceil(m / 64)). Unused bits of the last
+    word of each row are set to 0.
+    """
+    n, m = board.shape
+    n_words = -(-m // WORD_BITS)
+
+    bits = np.zeros((n, n_words * WORD_BITS), dtype=np.uint8)
+    bits[:, :m] = board != 0
+
+    packed = np.packbits(bits, axis=1, bitorder="little")
+
+    return np.ascontiguousarray(packed).view(_WORD_DTYPE)
+
+
+def unpack_board(packed: np.array, shape: Tuple[int, int]) -> np.array:
+    """Unpack a packed board into a game of life board.
+
+    Arguments
+    ---------
+    packed: Packed board as returned by pack_board.
+    shape: The (n, m) shape of the unpacked board.
+
+    Returns
+    -------
+    The game of life board (n, m) of 0's and 1's.
+    """
+    n, m = shape
+    as_bytes = np.ascontiguousarray(packed, dtype=_WORD_DTYPE).view(np.uint8)
+
+    return np.unpackbits(as_bytes, axis=1, count=m, bitorder="little").reshape(n, m)
+
+
+def _last_word_mask(m: int) -> np.uint64:
+    """Mask of the bits of the last word of a row that hold cells."""
+    used = m % WORD_BITS
+    if used == 0:
+        return np.uint64(np.iinfo(np.uint64).max)
+
+    return np.uint64((1 << used) - 1)
+
+
+def _shift_columns(
+    packed: np.array, m: int, mode: Literal["wrap", "zeros"]
+) -> Tuple[np.array, np.array]:
+    """Obtain the west and east neighbors of every cell.
+
+    Arguments
+    ---------
+    packed: Packed board (n, words).
+    m: Number of cells in each row.
+    mode: Edge behavior, "wrap" or "zeros".
+
+    Returns
+    -------
+    Two packed boards, where each bit holds the state of the cell to its
+    west and to its east respectively.
+    """
+    west = packed << _ONE
+    west[:, 1:] |= packed[:, :-1] >> _TOP
+
+    east = packed >> _ONE
+    east[:, :-1] |= packed[:, 1:] << _TOP
+
+    if mode == "wrap":
+        last_word, last_bit = divmod(m - 1, WORD_BITS)
+        last_bit = np.uint64(last_bit)
+
+        west[:, 0] |= (packed[:, last_word] >> last_bit) & _ONE
+        east[:, last_word] |= (packed[:, 0] & _ONE) << last_bit
+
+    return west, east
+
+
+def _shift_rows(
+    packed: np.array, mode: Literal["wrap", "zeros"]
+) -> Tuple[np.array, np.array]:
+    """Obtain the north and south rows of every row.
+
+    Arguments
+    ---------
+    packed: Packed board (n, words).
+    mode: Edge behavior, "wrap" or "zeros".
+
+    Returns
+    -------
+    Two packed boards, holding the row above and the row below each row.
+    """
+    if mode == "wrap":
+        return np.roll(packed, 1, axis=0), np.roll(packed, -1, axis=0)
+
+    north = np.zeros_like(packed)
+    north[1:] = packed[:-1]
+    south = np.zeros_like(packed)
+    south[:-1] = packed[1:]
+
+    return north, south
+
+
+def _add_bits(a: np.array, b: np.array, c: np.array) -> Tuple[np.array, np.array]:
+    """Full adder of three bit planes, returns the (sum, carry) planes."""
+    partial = a ^ b
+
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def _count_equals(bits: Tuple[np.array, ...], count: int) -> np.array:
+    """Mark the cells whose neighbor count, given by its bit planes, is count."""
+    equals = None
+    for plane, bit in zip(bits, range(4)):
+        term = plane if count >> bit & 1 else ~plane
+        equals = term if equals is None else equals & term
+
+    return equals
+
+
+def update_packed_board(
+    packed: np.array,
+    m: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """Move a packed board one generation in the game of life.
+
+    The operation is inmutable.
+
+    Arguments
+    ---------
+    packed: Packed board (n, words) as returned by pack_board.
+    m: Number of cells in each row of the unpacked board.
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    The packed board one generation older.
+    """
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    north, south = _shift_rows(packed, mode)
+
+    rows = []
+    for row in (north, packed, south):
+        west, east = _shift_columns(row, m, mode)
+        rows.append((west, row, east))
+
+    # Add the three cells of each row, obtaining a 2 bit count per row.
+    row_sums = [_add_bits(*row) for row in rows]
+
+    # The center cell is not a neighbor, so it is removed from the middle row
+    # by adding only its west and east cells.
+    west, _, east = rows[1]
+    row_sums[1] = (west ^ east, west & east)
+
+    # Add the three 2 bit counts into a 4 bit count.
+    ones, twos_a = _add_bits(row_sums[0][0], row_sums[1][0], row_sums[2][0])
+    twos_b, fours_a = _add_bits(row_sums[0][1], row_sums[1][1], row_sums[2][1])
+    carry = twos_a & twos_b
+    bits = (ones, twos_a ^ twos_b, fours_a ^ carry, fours_a & carry)
+
+    rule = parse_rule(rule)
+    equals = {count: _count_equals(bits, count) for count in rule.birth | rule.survival}
+
+    new_packed = np.zeros_like(packed)
+    for count in rule.birth:
+        new_packed |= equals[count] & ~packed
+    for count in rule.survival:
+        new_packed |= equals[count] & packed
+    new_packed[:, -1] &= _last_word_mask(m)
+
+    return new_packed
+
+
+def evolve_packed_board(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """
+    Iterate through a board `n` generations using the packed representation.
+
+    The board is packed once and only unpacked to yield each generation.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation.
+
+    Yields
+    ------
+    a new board with the state the current generation.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+
+    rule = parse_rule(rule)
+
+    packed = pack_board(board)
+    for _ in range(n_times):
+        packed = update_packed_board(packed, board_shape[1], mode, rule)
+        yield unpack_board(packed, board_shape)
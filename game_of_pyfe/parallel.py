@@ -0,0 +1,169 @@
+"""
+Multi-process game of life implementation.
+
+The board lives in two shared memory buffers, one for the current
+generation and one for the next. Each worker owns a strip of rows and
+reads the rows above and below its strip directly from the current
+buffer, so the only data sent to the workers are the strip limits.
+
+While the parent process copies a generation out of the shared memory, the
+workers already compute the next one.
+"""
+
+from multiprocessing import Pool, shared_memory
+from multiprocessing.pool import AsyncResult
+from typing import List, Literal, Tuple
+
+import numpy as np
+
+from .backends import get_backend, resolve_backend
+from .core import _gather_window, as_cells
+from .rules import CONWAY, Rule
+
+# Boards of the worker processes, attached to the shared memory buffers.
+_worker_boards: List[np.array] = []
+_worker_memory: List[shared_memory.SharedMemory] = []
+
+
+def _attach(names: Tuple[str, str], shape: Tuple[int, int], dtype: str) -> None:
+    """Attach a worker process to the shared memory buffers."""
+    for name in names:
+        memory = shared_memory.SharedMemory(name=name)
+        _worker_memory.append(memory)
+        _worker_boards.append(np.ndarray(shape, dtype=dtype, buffer=memory.buf))
+
+
+def _update_strip(
+    source: int,
+    start: int,
+    stop: int,
+    mode: Literal["wrap", "zeros"],
+    rule: Rule,
+    backend: str,
+) -> None:
+    """Move the rows [start, stop) of the source board one generation.
+
+    The result is written into the other board.
+    """
+    board = _worker_boards[source]
+
+    # One halo row above and below the strip. The step of the backend
+    # computes the halo rows wrong, and they are dropped.
+    strip = _gather_window(board, start - 1, stop + 1, 0, board.shape[1], mode)
+
+    step = get_backend(backend)
+    _worker_boards[1 - source][start:stop] = step(strip, mode, rule)[1:-1]
+
+
+def _strips(n_rows: int, n_strips: int) -> List[Tuple[int, int]]:
+    """Split the rows of a board into contiguous strips."""
+    limits = np.linspace(0, n_rows, min(n_strips, n_rows) + 1).astype(int)
+
+    return list(zip(limits[:-1].tolist(), limits[1:].tolist()))
+
+
+def _start_generation(
+    pool: Pool,
+    strips: List[Tuple[int, int]],
+    source: int,
+    mode: Literal["wrap", "zeros"],
+    rule: Rule,
+    backend: str,
+) -> AsyncResult:
+    """Start updating every strip of the source board in the workers."""
+    return pool.starmap_async(
+        _update_strip,
+        [(source, start, stop, mode, rule, backend) for start, stop in strips],
+    )
+
+
+def evolve_parallel_board(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    workers: int = 2,
+    rule: Rule = CONWAY,
+    reuse_buffers: bool = False,
+    backend: str = None,
+) -> np.array:
+    """
+    Iterate through a board `n` generations using a pool of processes.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior, "wrap" or "zeros".
+    workers: Number of worker processes.
+    rule: Life-like rule.
+    reuse_buffers: If True, the generations are copied into two boards
+    that take turns, and read-only views of them are yielded instead of new
+    boards. Each view is overwritten two generations later.
+    backend: Name of the backend computing the strips, by default the
+    default one, see game_of_pyfe.backends.
+
+    Yields
+    ------
+    a new board, or a read-only view, with the state the current
+    generation.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+    assert workers >= 1
+
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    board = as_cells(board)
+    backend = resolve_backend(backend)
+    # Two boards, so the previous generation is still valid while the
+    # current one is yielded, as in the other reuse_buffers engines.
+    if reuse_buffers:
+        new_boards = [np.empty_like(board, order="C") for _ in range(2)]
+    memory = [
+        shared_memory.SharedMemory(create=True, size=board.nbytes) for _ in range(2)
+    ]
+    boards = [
+        np.ndarray(board_shape, dtype=board.dtype, buffer=buffer.buf)
+        for buffer in memory
+    ]
+    try:
+        boards[0][:] = board
+
+        initargs = (
+            tuple(buffer.name for buffer in memory),
+            board_shape,
+            board.dtype.str,
+        )
+        with Pool(workers, initializer=_attach, initargs=initargs) as pool:
+            strips = _strips(board_shape[0], workers)
+            source = 0
+
+            if n_times > 0:
+                pending = _start_generation(pool, strips, source, mode, rule, backend)
+
+            for generation in range(1, n_times + 1):
+                pending.get()
+                source = 1 - source
+
+                # The workers compute the next generation, which only reads
+                # the source board, while it is copied.
+                if generation < n_times:
+                    pending = _start_generation(
+                        pool, strips, source, mode, rule, backend
+                    )
+
+                if reuse_buffers:
+                    new_board = new_boards[generation % 2]
+                    new_board[...] = boards[source]
+                    view = new_board.view()
+                    view.flags.writeable = False
+                    yield view
+                else:
+                    yield boards[source].copy()
+    finally:
+        # The views must be released before closing the buffers.
+        boards.clear()
+        for buffer in memory:
+            buffer.close()
+            buffer.unlink()
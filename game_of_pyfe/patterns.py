@@ -0,0 +1,355 @@
+"""
+Pattern files for game of pyfe.
+
+Reads and writes boards in the usual pattern formats:
+
+1. RLE (.rle), the run length encoded format with an `x = m, y = n` header.
+2. Plaintext (.cells), one row per line with `.` for dead and `O` for
+   living cells.
+3. Life 1.06 (.lif, .life), one `x y` coordinate per living cell. The
+   files written by game of pyfe keep the size of the board in a
+   `#D size m n` comment.
+
+The files are read line by line and decoded straight into a preallocated
+uint8 board, and the boards are written row by row, so no intermediate
+lists of cells are built.
+"""
+
+import os
+import re
+from typing import Iterator, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .core import CELL_DTYPE
+
+# Maximum length of the lines of an RLE file.
+RLE_LINE_LENGTH = 70
+
+_RLE_HEADER = re.compile(r"^x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)", re.IGNORECASE)
+_RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+_LIFE_106_HEADER = "#Life 1.06"
+_LIFE_106_SIZE = re.compile(r"^#D\s+size\s+(\d+)\s+(\d+)\s*$", re.IGNORECASE)
+
+_CELLS_DEAD = np.uint8(ord("."))
+_CELLS_ALIVE = np.uint8(ord("O"))
+
+
+def _pattern_format(path: str) -> str:
+    """Obtain the pattern format from the extension of a file."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".rle":
+        return "rle"
+    if extension == ".cells":
+        return "cells"
+    if extension in (".lif", ".life"):
+        return "life106"
+
+    raise ValueError("Pattern format of {} not supported".format(path))
+
+
+def _content_lines(pattern_file: TextIO, comment: str) -> Iterator[str]:
+    """Iterate the lines of a file without line breaks or comments."""
+    for line in pattern_file:
+        line = line.rstrip("\r\n")
+        if not line.startswith(comment):
+            yield line
+
+
+def read_rle(path: str) -> np.array:
+    """Read a board from an RLE file.
+
+    Arguments
+    ---------
+    path: Path to the RLE file.
+
+    Raises
+    ------
+    ValueError if the file is not valid RLE or the cells do not fit in the
+    size of the header.
+
+    Returns
+    -------
+    The uint8 game of life board with the shape of the header.
+    """
+    with open(path) as pattern_file:
+        lines = _content_lines(pattern_file, "#")
+
+        header = _RLE_HEADER.match(next(lines, "").strip())
+        if header is None:
+            raise ValueError("RLE file {} has no valid header".format(path))
+
+        m, n = int(header.group(1)), int(header.group(2))
+        board = np.zeros((n, m), dtype=CELL_DTYPE)
+
+        i, j = 0, 0
+        for line in lines:
+            for count, tag in _RLE_TOKEN.findall(line):
+                count = int(count) if count else 1
+
+                if tag == "!":
+                    return board
+                elif tag == "$":
+                    i, j = i + count, 0
+                elif tag == "b":
+                    j += count
+                elif tag == "o":
+                    if i >= n or j + count > m:
+                        raise ValueError(
+                            "RLE file {} has cells outside of the board".format(path)
+                        )
+                    board[i, j : j + count] = 1
+                    j += count
+                else:
+                    raise ValueError(
+                        "RLE file {} contains the tag {}".format(path, tag)
+                    )
+
+    return board
+
+
+def read_cells(path: str) -> np.array:
+    """Read a board from a plaintext file.
+
+    The file is read twice, first to obtain the size of the board and then
+    to fill it.
+
+    Arguments
+    ---------
+    path: Path to the plaintext file.
+
+    Raises
+    ------
+    ValueError if a row contains characters other than `.` and `O`.
+
+    Returns
+    -------
+    The uint8 game of life board. Short rows are filled with dead cells.
+    """
+    with open(path) as pattern_file:
+        n, m = 0, 0
+        for line in _content_lines(pattern_file, "!"):
+            n, m = n + 1, max(m, len(line))
+
+        board = np.zeros((n, m), dtype=CELL_DTYPE)
+
+        pattern_file.seek(0)
+        for i, line in enumerate(_content_lines(pattern_file, "!")):
+            row = np.frombuffer(line.encode(), dtype=np.uint8)
+            alive = row == _CELLS_ALIVE
+            if not np.all(alive | (row == _CELLS_DEAD)):
+                raise ValueError(
+                    "Plaintext file {} has an invalid row {}".format(path, i)
+                )
+            board[i, : len(row)] = alive
+
+    return board
+
+
+def _life_106_cells(pattern_file: TextIO, path: str) -> Iterator[Tuple[int, int]]:
+    """Iterate the (x, y) coordinates of a Life 1.06 file."""
+    for line in _content_lines(pattern_file, "#"):
+        coordinates = line.split()
+        if not coordinates:
+            continue
+        if len(coordinates) != 2:
+            raise ValueError(
+                "Life 1.06 file {} has an invalid line {}".format(path, line)
+            )
+        yield int(coordinates[0]), int(coordinates[1])
+
+
+def _life_106_size(pattern_file: TextIO) -> Optional[Tuple[int, int]]:
+    """Obtain the (n, m) shape of the `#D size m n` comment of a Life 1.06 file."""
+    for line in pattern_file:
+        if not line.startswith("#"):
+            break
+        match = _LIFE_106_SIZE.match(line.strip())
+        if match:
+            return int(match.group(2)), int(match.group(1))
+
+    return None
+
+
+def read_life_106(path: str) -> np.array:
+    """Read a board from a Life 1.06 file.
+
+    A `#D size m n` comment, as written by write_life_106, gives the shape
+    (n, m) of the board with the origin in its top left cell. Otherwise the
+    file is read twice, first to obtain the bounding box of the living cells
+    and then to fill the board.
+
+    Arguments
+    ---------
+    path: Path to the Life 1.06 file.
+
+    Raises
+    ------
+    ValueError if a line is not a pair of coordinates or a cell is outside
+    of the size of the board.
+
+    Returns
+    -------
+    The uint8 game of life board with the given size or spanning the
+    bounding box of the living cells, where x is the column and y the row.
+    """
+    with open(path) as pattern_file:
+        shape = _life_106_size(pattern_file)
+        pattern_file.seek(0)
+        if shape is not None:
+            x_min = y_min = 0
+        else:
+            x_min = y_min = x_max = y_max = None
+            for x, y in _life_106_cells(pattern_file, path):
+                if x_min is None:
+                    x_min, y_min, x_max, y_max = x, y, x, y
+                x_min, x_max = min(x_min, x), max(x_max, x)
+                y_min, y_max = min(y_min, y), max(y_max, y)
+
+            if x_min is None:
+                return np.zeros((0, 0), dtype=CELL_DTYPE)
+
+            shape = (y_max - y_min + 1, x_max - x_min + 1)
+            pattern_file.seek(0)
+
+        board = np.zeros(shape, dtype=CELL_DTYPE)
+        for x, y in _life_106_cells(pattern_file, path):
+            i, j = y - y_min, x - x_min
+            if not (0 <= i < shape[0] and 0 <= j < shape[1]):
+                raise ValueError(
+                    "Life 1.06 file {} has a cell outside of the board".format(path)
+                )
+            board[i, j] = 1
+
+    return board
+
+
+def read_pattern(path: str) -> np.array:
+    """Read a board from a pattern file, choosing the format by extension.
+
+    Arguments
+    ---------
+    path: Path to a .rle, .cells, .lif or .life file.
+
+    Raises
+    ------
+    ValueError if the extension is not supported or the file is not valid.
+
+    Returns
+    -------
+    The uint8 game of life board.
+    """
+    pattern_format = _pattern_format(path)
+    if pattern_format == "rle":
+        return read_rle(path)
+    if pattern_format == "cells":
+        return read_cells(path)
+
+    return read_life_106(path)
+
+
+def _rle_tokens(board: np.array) -> Iterator[str]:
+    """Iterate the run length tokens of a board, ending with `!`."""
+    pending_rows = 0
+    for row in board:
+        alive = row != 0
+        changes = np.flatnonzero(np.diff(alive)) + 1
+        starts = np.concatenate(([0], changes))
+        lengths = np.diff(np.concatenate((starts, [len(alive)])))
+        states = alive[starts]
+
+        # Trailing dead cells are implied by the end of the row.
+        if not states[-1]:
+            starts, lengths, states = starts[:-1], lengths[:-1], states[:-1]
+
+        if len(states) > 0:
+            if pending_rows:
+                yield "{}$".format(pending_rows if pending_rows > 1 else "")
+                pending_rows = 0
+
+            for length, state in zip(lengths.tolist(), states.tolist()):
+                yield "{}{}".format(length if length > 1 else "", "o" if state else "b")
+
+        pending_rows += 1
+
+    yield "!"
+
+
+def write_rle(board: np.array, path: str, rule: str = "B3/S23") -> None:
+    """Write a board to an RLE file.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    path: Path to the RLE file.
+    rule: Rule written in the header.
+    """
+    n, m = board.shape
+    with open(path, "w") as pattern_file:
+        pattern_file.write("x = {}, y = {}, rule = {}\n".format(m, n, rule))
+
+        line_length = 0
+        for token in _rle_tokens(board):
+            if line_length + len(token) > RLE_LINE_LENGTH:
+                pattern_file.write("\n")
+                line_length = 0
+            pattern_file.write(token)
+            line_length += len(token)
+        pattern_file.write("\n")
+
+
+def write_cells(board: np.array, path: str) -> None:
+    """Write a board to a plaintext file.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    path: Path to the plaintext file.
+    """
+    characters = np.array([_CELLS_DEAD, _CELLS_ALIVE], dtype=np.uint8)
+    with open(path, "w") as pattern_file:
+        pattern_file.write("!Name: {}\n".format(os.path.basename(path)))
+        for row in board:
+            pattern_file.write(characters[(row != 0).view(np.uint8)].tobytes().decode())
+            pattern_file.write("\n")
+
+
+def write_life_106(board: np.array, path: str) -> None:
+    """Write a board to a Life 1.06 file.
+
+    The coordinates are relative to the top left cell of the board, and the
+    size of the board is written in a `#D size m n` comment so the dead
+    border and the empty boards are kept.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    path: Path to the Life 1.06 file.
+    """
+    with open(path, "w") as pattern_file:
+        pattern_file.write("{}\n".format(_LIFE_106_HEADER))
+        pattern_file.write("#D size {} {}\n".format(board.shape[1], board.shape[0]))
+        for i, row in enumerate(board):
+            for j in np.flatnonzero(row).tolist():
+                pattern_file.write("{} {}\n".format(j, i))
+
+
+def write_pattern(board: np.array, path: str) -> None:
+    """Write a board to a pattern file, choosing the format by extension.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    path: Path to a .rle, .cells, .lif or .life file.
+
+    Raises
+    ------
+    ValueError if the extension is not supported.
+    """
+    pattern_format = _pattern_format(path)
+    if pattern_format == "rle":
+        write_rle(board, path)
+    elif pattern_format == "cells":
+        write_cells(board, path)
+    else:
+        write_life_106(board, path)
@@ -0,0 +1,160 @@
+"""
+Compute and render pipeline for game of pyfe.
+
+The boards are computed by a background thread into a bounded queue while
+the renderer takes them at a target frame rate. When frames are dropped,
+the computation never waits for the renderer: the oldest boards in the
+queue are discarded and each frame shows the newest board available, so
+fast runs are watched in real time and reach the last generation as soon
+as the engine allows.
+"""
+
+import queue
+import threading
+import time
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+# Marks the end of the boards in the queue.
+_END = object()
+
+
+class FramePipeline:
+    """Iterate boards computed in a background thread at a target rate.
+
+    The last board is never dropped. Boards that are read-only views, like
+    the ones of evolve_board with reuse_buffers=True, are copied before
+    being queued.
+
+    Arguments
+    ---------
+    boards: Boards of each generation, for example from evolve_board.
+    fps: Target frames per second, None to not wait between frames.
+    max_frames: Maximum number of boards waiting in the queue.
+    drop_frames: Drop the boards the renderer can not keep up with instead
+    of pausing the computation.
+
+    Attributes
+    ----------
+    dropped: Number of boards dropped.
+    """
+
+    def __init__(
+        self,
+        boards: Iterable[np.array],
+        fps: Optional[float] = None,
+        max_frames: int = 8,
+        drop_frames: bool = False,
+    ):
+        assert max_frames >= 1
+        assert fps is None or fps > 0
+
+        self.fps = fps
+        self.drop_frames = drop_frames
+        self.dropped = 0
+
+        self._boards = boards
+        self._queue = queue.Queue(max_frames)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _put(self, item) -> bool:
+        """Queue an item, returns False if the pipeline was closed."""
+        if self.drop_frames:
+            with self._lock:
+                while True:
+                    try:
+                        self._queue.put_nowait(item)
+                        return True
+                    except queue.Full:
+                        self._queue.get_nowait()
+                        self.dropped += 1
+
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _produce(self) -> None:
+        """Compute the boards into the queue."""
+        boards = iter(self._boards)
+        try:
+            for generation, board in enumerate(boards):
+                if self._stop.is_set():
+                    return
+                if not board.flags.writeable:
+                    board = board.copy()
+                if not self._put((generation, board)):
+                    return
+        except BaseException as error:
+            self._error = error
+        finally:
+            # Generators release their resources, like shared memory, here.
+            if hasattr(boards, "close"):
+                boards.close()
+            self._put(_END)
+
+    def _get_latest(self):
+        """Wait for the next item and skip to the newest one queued."""
+        item = self._queue.get()
+        if not self.drop_frames:
+            return item
+
+        with self._lock:
+            while item is not _END:
+                try:
+                    newer = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is not _END:
+                    self.dropped += 1
+                    item = newer
+                else:
+                    # Keep the end for the next call, the board is shown first.
+                    self._queue.put_nowait(newer)
+                    break
+
+        return item
+
+    def __iter__(self) -> Iterator[Tuple[int, np.array]]:
+        """Start the computation and iterate the boards.
+
+        Yields
+        ------
+        the number of the generation, counting from 0, and its board.
+        """
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+        try:
+            next_frame = time.monotonic()
+            while True:
+                item = self._get_latest()
+                if item is _END:
+                    break
+
+                if self.fps is not None:
+                    delay = next_frame - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    next_frame = max(next_frame, time.monotonic()) + 1 / self.fps
+
+                yield item
+
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the computation and wait for the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
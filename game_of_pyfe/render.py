@@ -0,0 +1,122 @@
+"""
+Differential terminal renderer for game of pyfe.
+
+The renderer keeps the last frame drawn in the terminal and, for the
+next frames, only moves the cursor to the runs of characters that changed
+and rewrites them with ANSI escape sequences. Each frame is sent to the
+terminal with a single write, so large boards animate without flicker.
+"""
+
+import sys
+from typing import Optional, TextIO
+
+import numpy as np
+
+from .viewport import Viewport
+
+ALIVE = "█"
+DEAD = " "
+
+_CLEAR = "\x1b[2J"
+_CLEAR_LINE = "\x1b[K"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+# The first line of the terminal holds the generation.
+_HEADER_LINES = 1
+
+
+def _move(row: int, column: int) -> str:
+    """Escape sequence moving the cursor to a 0 based row and column."""
+    return "\x1b[{};{}H".format(row + 1, column + 1)
+
+
+class TerminalRenderer:
+    """Draw game of life boards in an ANSI terminal.
+
+    Arguments
+    ---------
+    stream: Text stream of the terminal.
+    alive: Character of the living cells.
+    dead: Character of the dead cells.
+    viewport: Window of the boards drawn, by default the whole board with
+    one character per cell.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        alive: str = ALIVE,
+        dead: str = DEAD,
+        viewport: Optional[Viewport] = None,
+    ):
+        self.stream = sys.stdout if stream is None else stream
+        self.viewport = viewport
+        self._glyphs = np.array([ord(dead), ord(alive)], dtype="<u4")
+        self._previous: Optional[np.array] = None
+
+    def _code_points(self, board: np.array) -> np.array:
+        """Obtain the code points of the characters drawn for a board."""
+        if self.viewport is not None:
+            return self.viewport.glyphs(board)
+
+        return self._glyphs[(board != 0).view(np.uint8)]
+
+    def _frame_text(self, code_points: np.array) -> str:
+        """Join the characters into a string, one line per row."""
+        n, m = code_points.shape
+        lines = np.full((n, m + 1), ord("\n"), dtype="<u4")
+        lines[:, :m] = code_points
+
+        return lines.tobytes().decode("utf-32-le")
+
+    def render(self, board: np.array, generation: int) -> None:
+        """Draw a board, rewriting the characters changed since the last one.
+
+        Arguments
+        ---------
+        board: Game of life board.
+        generation: Number of the generation.
+        """
+        code_points = self._code_points(board)
+        n, m = code_points.shape
+        text = self._frame_text(code_points)
+
+        parts = [_move(0, 0), "Generation: {}".format(generation), _CLEAR_LINE]
+        if self._previous is None or self._previous.shape != code_points.shape:
+            parts.insert(0, _HIDE_CURSOR + _CLEAR)
+            parts.append(_move(_HEADER_LINES, 0))
+            parts.append(text)
+        else:
+            rows, columns = np.nonzero(code_points != self._previous)
+
+            # A run of changed characters starts where the previous changed
+            # character is not the one to its left.
+            starts = np.ones(len(rows), dtype=bool)
+            starts[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1] + 1)
+            start_index = np.flatnonzero(starts)
+            stop_index = np.append(start_index[1:], len(rows))
+
+            for start, stop in zip(start_index.tolist(), stop_index.tolist()):
+                row, column = int(rows[start]), int(columns[start])
+                offset = row * (m + 1) + column
+                parts.append(_move(_HEADER_LINES + row, column))
+                parts.append(text[offset : offset + stop - start])
+
+        parts.append(_move(_HEADER_LINES + n, 0))
+
+        self.stream.write("".join(parts))
+        self.stream.flush()
+        self._previous = code_points
+
+    def close(self) -> None:
+        """Show the cursor again, below the last board."""
+        self.stream.write(_SHOW_CURSOR)
+        self.stream.flush()
+        self._previous = None
+
+    def __enter__(self) -> "TerminalRenderer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,94 @@
+"""
+Life-like rules for game of pyfe.
+
+A rule is written in B/S notation, where the digits after B are the
+neighbor counts that make a dead cell live and the digits after S are the
+neighbor counts that keep a living cell alive. Conway's game of life is
+B3/S23.
+
+Each rule is compiled into a lookup table indexed by the field sum of a
+cell (center cell included) plus 10 when the cell is alive, so every rule
+is applied with the same single table lookup.
+"""
+
+import re
+from typing import FrozenSet, Union
+
+import numpy as np
+
+# Offset of the lookup table index for living cells.
+ALIVE_OFFSET = 10
+
+_NOTATION = re.compile(r"^B([0-8]*)/S([0-8]*)$|^S([0-8]*)/B([0-8]*)$", re.IGNORECASE)
+
+
+class Rule:
+    """Life-like rule in B/S notation.
+
+    Arguments
+    ---------
+    notation: The rule, for example "B3/S23" or "S23/B3".
+
+    Raises
+    ------
+    ValueError if the notation is not valid.
+
+    Attributes
+    ----------
+    birth: Neighbor counts that make a dead cell live.
+    survival: Neighbor counts that keep a living cell alive.
+    table: Lookup table of the next cell state, indexed by the field sum
+    plus ALIVE_OFFSET for living cells.
+    """
+
+    def __init__(self, notation: str):
+        match = _NOTATION.match(notation.strip())
+        if match is None:
+            raise ValueError("Rule {} is not in B/S notation".format(notation))
+
+        birth, survival, survival_first, birth_last = match.groups()
+        if birth is None:
+            birth, survival = birth_last, survival_first
+
+        self.birth: FrozenSet[int] = frozenset(int(count) for count in birth)
+        self.survival: FrozenSet[int] = frozenset(int(count) for count in survival)
+
+        self.table = np.zeros(2 * ALIVE_OFFSET, dtype=np.uint8)
+        for count in self.birth:
+            self.table[count] = 1
+        for count in self.survival:
+            # The field sum of a living cell includes the cell itself.
+            self.table[ALIVE_OFFSET + count + 1] = 1
+        self.table.flags.writeable = False
+
+    def __str__(self) -> str:
+        return "B{}/S{}".format(
+            "".join(str(count) for count in sorted(self.birth)),
+            "".join(str(count) for count in sorted(self.survival)),
+        )
+
+    def __repr__(self) -> str:
+        return "Rule({!r})".format(str(self))
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Rule)
+            and self.birth == other.birth
+            and self.survival == other.survival
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.birth, self.survival))
+
+
+CONWAY = Rule("B3/S23")
+HIGHLIFE = Rule("B36/S23")
+DAY_AND_NIGHT = Rule("B3678/S34678")
+
+
+def parse_rule(rule: Union[str, Rule]) -> Rule:
+    """Obtain a Rule from a rule or its B/S notation."""
+    if isinstance(rule, Rule):
+        return rule
+
+    return Rule(rule)
@@ -0,0 +1,169 @@
+"""
+Sparse game of life implementation.
+
+Only the coordinates of the living cells are stored. Each generation the
+fields of the living cells are counted, so the cost of a generation
+depends on the population and not on the size of the board.
+"""
+
+from typing import Literal, Tuple, Union
+
+import numpy as np
+
+from .rules import ALIVE_OFFSET, CONWAY, Rule, parse_rule
+
+_OFFSETS = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1)]
+
+
+def board_to_cells(board: np.array) -> np.array:
+    """Obtain the coordinates of the living cells of a board.
+
+    Arguments
+    ---------
+    board: Game of life board (n, m).
+
+    Returns
+    -------
+    The (i, j) coordinates of the living cells with shape (k, 2), sorted
+    by row and then by column.
+    """
+    return np.argwhere(board != 0)
+
+
+def cells_to_board(
+    cells: np.array, shape: Tuple[int, int], dtype: np.dtype = np.uint8
+) -> np.array:
+    """Build a board from the coordinates of its living cells.
+
+    Arguments
+    ---------
+    cells: The (i, j) coordinates of the living cells with shape (k, 2).
+    shape: The (n, m) shape of the board.
+    dtype: The dtype of the board.
+
+    Returns
+    -------
+    The game of life board (n, m).
+    """
+    board = np.zeros(shape, dtype=dtype)
+    board[cells[:, 0], cells[:, 1]] = 1
+
+    return board
+
+
+def update_cells(
+    cells: np.array,
+    shape: Tuple[int, int],
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """Move the living cells one generation in the game of life.
+
+    The field sum of a cell is the number of living cells whose field
+    contains it, so only the living cells and their neighbors are visited.
+
+    Arguments
+    ---------
+    cells: The (i, j) coordinates of the living cells with shape (k, 2),
+    sorted as given by board_to_cells.
+    shape: The (n, m) shape of the board.
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation. Rules where cells are born
+    without living neighbors (B0) are not supported.
+
+    Raises
+    ------
+    ValueError if the rule contains B0.
+
+    Returns
+    -------
+    The coordinates of the living cells one generation older.
+    """
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    rule = parse_rule(rule)
+    if 0 in rule.birth:
+        raise ValueError("Rule {} births cells without neighbors".format(rule))
+
+    n, m = shape
+    rows = cells[:, 0]
+    cols = cells[:, 1]
+
+    candidates = []
+    for di, dj in _OFFSETS:
+        i = rows + di
+        j = cols + dj
+        if mode == "wrap":
+            i %= n
+            j %= m
+        else:
+            inside = (i >= 0) & (i < n) & (j >= 0) & (j < m)
+            i = i[inside]
+            j = j[inside]
+        candidates.append(i * m + j)
+
+    index, total = np.unique(np.concatenate(candidates), return_counts=True)
+
+    alive = np.isin(index, rows * m + cols, assume_unique=True)
+
+    index = index[rule.table[total + ALIVE_OFFSET * alive] != 0]
+
+    return np.stack(np.divmod(index, m), axis=1)
+
+
+def evolve_cells(
+    cells: np.array,
+    shape: Tuple[int, int],
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """
+    Iterate through the living cells `n` generations.
+
+    Arguments
+    ---------
+    cells: The (i, j) coordinates of the living cells with shape (k, 2).
+    shape: The (n, m) shape of the board where n >= 2 and m >= 2
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation, without B0.
+
+    Yields
+    ------
+    the coordinates of the living cells of the current generation.
+    """
+    assert shape[0] >= 2 and shape[1] >= 2
+
+    rule = parse_rule(rule)
+    for _ in range(n_times):
+        cells = update_cells(cells, shape, mode, rule)
+        yield cells
+
+
+def evolve_sparse_board(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    rule: Union[str, Rule] = CONWAY,
+) -> np.array:
+    """
+    Iterate through a board `n` generations using the sparse representation.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior, "wrap" or "zeros".
+    rule: Life-like rule or its B/S notation, without B0.
+
+    Yields
+    ------
+    a new board with the state the current generation.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+
+    cells = board_to_cells(board)
+    for cells in evolve_cells(cells, board_shape, n_times, mode, rule):
+        yield cells_to_board(cells, board_shape)
@@ -0,0 +1,139 @@
+"""
+Test suit for backends.py file.
+"""
+import warnings
+
+import numpy as np
+
+from .. import backends
+from ..core import _step, evolve_board, update_board
+from ..rules import CONWAY, DAY_AND_NIGHT, HIGHLIFE
+from .base_test import BaseTestCase, unittest
+
+
+class TestRegistry(BaseTestCase):
+    """
+    Tests for the registry of backends.
+    """
+
+    def setUp(self):
+        backends.register_backend("missing", "game_of_pyfe.missing_backend", "step")
+        backends.register_backend("copy", ".core", "_step")
+
+    def tearDown(self):
+        for name in ["missing", "copy"]:
+            del backends._REGISTRY[name]
+            backends._loaded.pop(name, None)
+            backends._unavailable.pop(name, None)
+
+    def test_exception_raising(self):
+        """Test that unknown backends are rejected."""
+        board = np.eye(3)
+
+        self.assertRaises(TypeError, backends.get_backend, "nil")
+        self.assertRaises(TypeError, backends.set_default_backend, "nil")
+        self.assertRaises(TypeError, update_board, board, backend="nil")
+
+    def test_available_backends(self):
+        """Test that only the backends that can be imported are available."""
+        available = backends.available_backends()
+
+        self.assertEqual(available[0], "numpy")
+        self.assertIn("copy", available)
+        self.assertNotIn("missing", available)
+        self.assertIs(backends.get_backend("copy"), _step)
+
+    def test_fallback(self):
+        """Test that a missing backend warns and uses the numpy one."""
+        board = np.zeros((5, 5))
+        board[2, 1:4] = 1
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = update_board(board, backend="missing")
+            results = list(evolve_board(board, 2, backend="missing"))
+
+        self.assertEqual(backends.resolve_backend("copy"), "copy")
+        self.assertTrue(caught)
+        for warning in caught:
+            self.assertIs(warning.category, RuntimeWarning)
+            self.assertIn("missing_backend", str(warning.message))
+        self.assert_array_equal(result, board.T)
+        self.assert_array_equal(results[1], board)
+
+    def test_default_backend(self):
+        """Test that the default backend is used when none is given."""
+        previous = backends.set_default_backend("missing")
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                backends.get_backend()
+        finally:
+            self.assertEqual(backends.set_default_backend(previous), "missing")
+
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(backends.resolve_backend(), previous)
+
+    def test_step_backend(self):
+        """Test that the boards evolved with the step of a backend match the\
+        numpy engines, with and without reused buffers."""
+        board = np.random.default_rng(0).integers(0, 2, (6, 7))
+
+        for mode in ["wrap", "zeros"]:
+            for reuse_buffers in [False, True]:
+                with self.subTest(mode=mode, reuse_buffers=reuse_buffers):
+                    expected_results = evolve_board(board, 4, mode)
+                    results = evolve_board(
+                        board, 4, mode, reuse_buffers=reuse_buffers, backend="copy"
+                    )
+
+                    for result, expected_result in zip(results, expected_results):
+                        self.assert_array_equal(result, expected_result)
+                        self.assertEqual(result.flags.writeable, not reuse_buffers)
+
+    def test_fortran_order(self):
+        """Test that Fortran ordered boards and outputs keep the next\
+        generation."""
+        board = np.random.default_rng(1).integers(0, 2, (8, 9)).astype(np.uint8)
+        fortran_board = np.asfortranarray(board)
+        expected_results = list(evolve_board(board, 3))
+
+        out = np.empty_like(fortran_board)
+        result = _step(fortran_board, out=out)
+
+        self.assertIs(result, out)
+        self.assert_array_equal(result, expected_results[0])
+        for reuse_buffers in [False, True]:
+            with self.subTest(reuse_buffers=reuse_buffers):
+                results = evolve_board(
+                    fortran_board, 3, reuse_buffers=reuse_buffers, backend="copy"
+                )
+
+                for result, expected_result in zip(results, expected_results):
+                    self.assert_array_equal(result, expected_result)
+
+
+@unittest.skipUnless("numba" in backends.available_backends(), "requires numba")
+class TestNumba(BaseTestCase):
+    """
+    Tests for the kernel of the numba backend.
+    """
+
+    def test_fused_step(self):
+        """Test that the Python function of the compiled kernel matches the\
+        numpy backend."""
+        from .. import jit
+
+        rng = np.random.default_rng(2)
+        for shape in [(2, 2), (3, 5), (8, 7)]:
+            board = rng.integers(0, 2, shape).astype(np.uint8)
+            for mode in ["wrap", "zeros"]:
+                for rule in [CONWAY, HIGHLIFE, DAY_AND_NIGHT]:
+                    with self.subTest(shape=shape, mode=mode, rule=str(rule)):
+                        out = np.empty_like(board)
+
+                        jit._fused_step.py_func(
+                            board, rule.table.astype(board.dtype), mode == "wrap", out
+                        )
+
+                        self.assert_array_equal(out, _step(board, mode, rule))
@@ -0,0 +1,80 @@
+"""
+Test suit for batch.py file.
+"""
+import numpy as np
+
+from ..batch import advance_boards, evolve_boards, update_boards
+from ..core import evolve_board, update_board
+from .base_test import BaseTestCase, unittest
+
+
+class TestUpdateBoards(BaseTestCase):
+    """
+    Tests for the update_boards function.
+    """
+
+    def test_exception_raising(self):
+        """Test for boards that are not a stack, are too small or have an\
+        unknown mode."""
+        boards = np.zeros([2, 2])
+        self.assertRaises(AssertionError, update_boards, boards)
+
+        boards = np.zeros([3, 1, 2])
+        self.assertRaises(AssertionError, update_boards, boards)
+
+        boards = np.zeros([2, 3, 3])
+        self.assertRaises(TypeError, update_boards, boards, "nil")
+        self.assertRaises(TypeError, update_boards, boards, ["wrap", "nil"])
+
+    def test_shared_mode(self):
+        """Test that each board is updated as by update_board."""
+        rng = np.random.default_rng(0)
+        boards = rng.integers(0, 2, (6, 5, 7))
+
+        for mode in ["wrap", "zeros"]:
+            result = update_boards(boards, mode)
+
+            for board, board_result in zip(boards, result):
+                self.assert_array_equal(board_result, update_board(board, mode))
+
+    def test_mode_per_board(self):
+        """Test that each board uses its own edge mode."""
+        rng = np.random.default_rng(1)
+        boards = rng.integers(0, 2, (4, 6, 6))
+        modes = ["wrap", "zeros", "zeros", "wrap"]
+
+        result = update_boards(boards, modes)
+
+        for board, mode, board_result in zip(boards, modes, result):
+            self.assert_array_equal(board_result, update_board(board, mode))
+
+
+class TestEvolveBoards(BaseTestCase):
+    """
+    Tests for the evolve_boards and advance_boards functions.
+    """
+
+    def test_matches_evolve_board(self):
+        """Test that each board evolves as by evolve_board."""
+        rng = np.random.default_rng(2)
+        boards = rng.integers(0, 2, (3, 8, 5))
+        modes = ["zeros", "wrap", "zeros"]
+
+        results = list(evolve_boards(boards, 6, modes))
+
+        self.assertEqual(len(results), 6)
+        for i, (board, mode) in enumerate(zip(boards, modes)):
+            expected_results = list(evolve_board(board, 6, mode))
+            for result, expected_result in zip(results, expected_results):
+                self.assert_array_equal(result[i], expected_result)
+
+        self.assert_array_equal(advance_boards(boards, 6, modes), results[-1])
+
+    def test_zero_generations(self):
+        """Test that advancing 0 generations returns a copy."""
+        boards = np.ones([2, 3, 3])
+
+        result = advance_boards(boards, 0)
+
+        self.assert_array_equal(result, boards)
+        self.assertIsNot(result, boards)
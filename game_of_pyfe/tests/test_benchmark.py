@@ -0,0 +1,69 @@
+"""
+Test suit for benchmark.py file.
+"""
+import json
+import os
+import tempfile
+
+from ..benchmark import BENCHMARKS, compare, main, run_startup, run_suite
+from .base_test import BaseTestCase, unittest
+
+
+class TestBenchmark(BaseTestCase):
+    """
+    Tests for the benchmark suite.
+    """
+
+    def test_run_suite(self):
+        """Test that every combination is measured."""
+        results = run_suite(sizes=[64], densities=[0.1, 0.5], repeat=1)
+
+        self.assertEqual(len(results), len(BENCHMARKS) * 2 * 2)
+        for result in results:
+            self.assertGreater(result["cells_per_second"], 0)
+            self.assertGreater(result["peak_bytes"], 0)
+
+    def test_compare(self):
+        """Test that slower or bigger results are regressions."""
+        baseline = run_suite(["update_board"], [64], [0.5], ["wrap"], repeat=1)
+        result = dict(baseline[0])
+
+        self.assertEqual(compare([result], baseline), [])
+
+        result["cells_per_second"] = baseline[0]["cells_per_second"] / 2
+        result["peak_bytes"] = baseline[0]["peak_bytes"] * 2
+        self.assertEqual(len(compare([result], baseline)), 2)
+
+        result["mode"] = "zeros"
+        self.assertEqual(compare([result], baseline), [])
+
+    def test_startup(self):
+        """Test that the start up is measured and compared by its time."""
+        results = run_startup(repeat=1, size=8)
+
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertGreater(result["seconds"], 0)
+        self.assertEqual(compare(results, results), [])
+
+        slower = [dict(result, seconds=result["seconds"] * 2) for result in results]
+        slower[1]["cells_per_second"] /= 2
+        self.assertEqual(len(compare(slower, results)), 2)
+
+    def test_main(self):
+        """Test saving the results and comparing them with a baseline."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            argv = ["--benchmarks", "update_board", "--sizes", "64", "--repeat", "1"]
+
+            self.assertEqual(main(argv + ["--output", output]), 0)
+            with open(output) as output_file:
+                baseline = json.load(output_file)
+            self.assertEqual(len(baseline), 4)
+
+            for result in baseline:
+                result["cells_per_second"] *= 1000
+            with open(output, "w") as output_file:
+                json.dump(baseline, output_file)
+
+            self.assertEqual(main(argv + ["--baseline", output]), 1)
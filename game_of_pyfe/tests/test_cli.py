@@ -0,0 +1,116 @@
+"""
+Test suit for cli.py file.
+"""
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from ..cli import main
+from .base_test import BaseTestCase, unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestMain(BaseTestCase):
+    """
+    Tests for the main function.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conf_file = os.path.join(self.directory.name, "conf.json")
+
+        board = np.zeros((6, 6), dtype=int)
+        board[2, 1:4] = 1
+        with open(self.conf_file, "w") as conf:
+            json.dump(
+                {
+                    "board": board.tolist(),
+                    "edge_mode": "zeros",
+                    "time_delay": 0,
+                    "generations": 3,
+                    "cycle_history": 8,
+                    "on_cycle": "stop",
+                },
+                conf,
+            )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, *argv: str) -> str:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            main(["--conf-file", self.conf_file, *argv])
+
+        return stdout.getvalue()
+
+    def test_headless(self):
+        """Test that a headless run reports the generations and writes the\
+        last board."""
+        output = os.path.join(self.directory.name, "last.npy")
+
+        printed = self.run_main("--headless", "--output", output)
+
+        self.assertIn("Generations: 2", printed)
+        self.assertIn("Cells/sec", printed)
+        self.assertIn("Cycle of period 2 detected starting at generation 0", printed)
+        # The blinker is back to its first phase in the last generation.
+        expected_board = np.zeros((6, 6))
+        expected_board[2, 1:4] = 1
+        self.assert_array_equal(np.load(output), expected_board)
+
+    def test_exception_raising(self):
+        """Test the arguments that can not be combined."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, self.run_main, "--headless", "--every", "2")
+            self.assertRaises(SystemExit, self.run_main, "--stats", "-")
+
+
+class TestStartup(BaseTestCase):
+    """
+    Tests for the start up of the application.
+    """
+
+    def run_python(self, code: str) -> str:
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+
+    def test_lazy_imports(self):
+        """Test that importing the interface and printing the help neither\
+        parse the process arguments nor import numpy."""
+        printed = self.run_python(
+            "import sys\n"
+            "sys.argv.append('--unknown')\n"
+            "from game_of_pyfe import cli\n"
+            "try:\n"
+            "    cli.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('numpy' in sys.modules)\n"
+        )
+
+        self.assertIn("usage: game-of-pyfe", printed)
+        self.assertEqual(printed.splitlines()[-1], "False")
+
+    def test_module(self):
+        """Test that the package runs with python -m."""
+        printed = self.run_python(
+            "import runpy, sys\n"
+            "sys.argv = ['game_of_pyfe', '--help']\n"
+            "runpy.run_module('game_of_pyfe', run_name='__main__')\n"
+        )
+
+        self.assertIn("usage: game-of-pyfe", printed)
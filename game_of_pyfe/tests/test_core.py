@@ -2,13 +2,40 @@
 Test suit for core.py file.
 """
 import math
+import tracemalloc
 
 import numpy as np
 
-from ..core import evolve_board, generate_fields, update_board, update_cell
+from ..backends import available_backends, set_default_backend
+from ..core import (
+    CELL_DTYPE,
+    _gather_window,
+    _pad_board,
+    as_cells,
+    evolve_board,
+    evolve_region,
+    generate_fields,
+    jump_board,
+    update_board,
+    update_cell,
+)
 from .base_test import BaseTestCase, unittest
 
 
+class BackendTestCase(BaseTestCase):
+    """
+    Test case run with `backend` as the default backend.
+    """
+
+    backend = "numpy"
+
+    def setUp(self):
+        self.previous_backend = set_default_backend(self.backend)
+
+    def tearDown(self):
+        set_default_backend(self.previous_backend)
+
+
 class TestGenerateFields(BaseTestCase):
     """
     Tests for the generate_fields function.
@@ -150,6 +177,39 @@ def test_zeros_mode(self):
         self.assert_array_equal(result, expected_result)
 
 
+class TestGatherWindow(BaseTestCase):
+    """
+    Tests for the _gather_window function.
+    """
+
+    def test_exception_raising(self):
+        """Test for a mode that does not exist."""
+        board = np.zeros([2, 2])
+        self.assertRaises(TypeError, _gather_window, board, 0, 1, 0, 1, "nil")
+
+    def test_halo(self):
+        """Test that the whole board with its halo is the padded board, and\
+        that windows past the edges wrap or are 0's."""
+        board = np.arange(12).reshape(3, 4) % 2
+
+        for mode in ["wrap", "zeros"]:
+            with self.subTest(mode=mode):
+                result = _gather_window(board, -1, 4, -1, 5, mode)
+
+                self.assert_array_equal(result, _pad_board(board, mode))
+                self.assertEqual(result.dtype, CELL_DTYPE)
+
+        result = _gather_window(board, 2, 5, 3, 5, "wrap")
+        self.assert_array_equal(result, [[1, 0], [1, 0], [1, 0]])
+
+        result = _gather_window(board, 2, 5, 3, 5, "zeros")
+        self.assert_array_equal(result, [[1, 0], [0, 0], [0, 0]])
+
+        result = _gather_window(board, 0, 2, 0, 4, "zeros")
+        self.assert_array_equal(result, board[:2])
+        self.assertFalse(np.shares_memory(result, board))
+
+
 class TestUpdateCell(BaseTestCase):
     """
     Tests for the update_cell function.
@@ -221,7 +281,7 @@ def test_death_state(self):
         self.assertEqual(0, update_cell(field))
 
 
-class TestUpdateBoard(BaseTestCase):
+class TestUpdateBoard(BackendTestCase):
     """
     Tests for the update_board function.
     """
@@ -321,8 +381,32 @@ def test_oscillator_edge_zeros(self):
 
         self.assert_array_equal(result, expected_result)
 
+    def test_matches_update_cell(self):
+        """Test that the whole board update matches applying update_cell\
+        to every field."""
+        rng = np.random.default_rng(0)
+        for mode in ["wrap", "zeros"]:
+            board = rng.integers(0, 2, (7, 9))
+            fields = generate_fields(board, mode)
+            expected_result = np.array(
+                [[update_cell(field) for field in row] for row in fields]
+            )
+
+            result = update_board(board, mode)
+
+            self.assert_array_equal(result, expected_result)
 
-class TestEvolveBoard(BaseTestCase):
+    def test_inmutable(self):
+        """Test that the original board is not modified."""
+        board = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0]])
+        original = board.copy()
+
+        update_board(board)
+
+        self.assert_array_equal(board, original)
+
+
+class TestEvolveBoard(BackendTestCase):
     """
     Tests for the evolve_board function.
     """
@@ -397,3 +481,228 @@ def test_simplespaceship(self):
 
         for next_board, expected_result in zip(next_boards, expected_results):
             self.assert_array_equal(next_board, expected_result)
+
+    def test_reuse_buffers(self):
+        """Test that the double buffered mode yields the same generations\
+        as read-only views."""
+        rng = np.random.default_rng(1)
+        for dtype in [int, np.uint8, bool]:
+            board = rng.integers(0, 2, (7, 9)).astype(dtype)
+
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(dtype=dtype, mode=mode):
+                    expected_results = evolve_board(board, 6, mode)
+                    results = evolve_board(board, 6, mode, reuse_buffers=True)
+
+                    for result, expected_result in zip(results, expected_results):
+                        self.assert_array_equal(result, expected_result)
+                        self.assertFalse(result.flags.writeable)
+
+    def test_reuse_buffers_allocation(self):
+        """Test that the double buffered mode does not allocate boards after\
+        the first generation."""
+        board = np.random.default_rng(2).integers(0, 2, (1000, 1000), dtype=np.uint8)
+        iterator = evolve_board(board, 10, reuse_buffers=True)
+        next(iterator)
+
+        tracemalloc.start()
+        try:
+            for _ in iterator:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak, board.nbytes)
+
+    def test_workers(self):
+        """Test that the generations do not depend on the number of\
+        workers."""
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (9, 6))
+
+        for mode in ["wrap", "zeros"]:
+            expected_results = list(evolve_board(board, 5, mode))
+
+            for workers in [2, 3]:
+                with self.subTest(mode=mode, workers=workers):
+                    results = list(evolve_board(board, 5, mode, workers=workers))
+
+                    self.assertEqual(len(results), len(expected_results))
+                    for result, expected_result in zip(results, expected_results):
+                        self.assert_array_equal(result, expected_result)
+
+
+class TestJumpBoard(BaseTestCase):
+    """
+    Tests for the jump_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis or the\
+        mode does not exist."""
+        board = np.zeros([1, 1])
+        self.assertRaises(AssertionError, jump_board, board, 1)
+
+        board = np.zeros([2, 2])
+        self.assertRaises(TypeError, jump_board, board, 1, "nil")
+
+    def test_zero_generations(self):
+        """Test that a copy of the board is returned for 0 generations."""
+        board = np.eye(3)
+
+        result = jump_board(board, 0)
+
+        self.assert_array_equal(result, board)
+        self.assertIsNot(result, board)
+
+    def test_matches_evolve_board(self):
+        """Test that jumping gives the same board as evolving."""
+        rng = np.random.default_rng(3)
+        for shape in [(2, 2), (5, 7), (8, 8), (16, 9)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = rng.integers(0, 2, shape)
+                    boards = [board] + list(evolve_board(board, 40, mode))
+
+                    for generations in [1, 2, 5, 13, 40]:
+                        result = jump_board(board, generations, mode)
+
+                        self.assert_array_equal(result, boards[generations])
+
+    def test_huge_jump(self):
+        """Test a glider in a toroid board, which returns to its position\
+        every 32 generations in an (8, 8) board."""
+        board = np.zeros([8, 8])
+        board[0, 1] = board[1, 2] = board[2, 0] = board[2, 1] = board[2, 2] = 1
+
+        result = jump_board(board, 32 * 10 ** 6)
+
+        self.assert_array_equal(result, board)
+
+
+class TestEvolveRegion(BackendTestCase):
+    """
+    Tests for the evolve_region function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis or the\
+        mode does not exist."""
+        board = np.zeros([1, 1])
+        self.assertRaises(AssertionError, evolve_region, board, (0, 0, 1, 1), 1)
+
+        board = np.zeros([2, 2])
+        self.assertRaises(TypeError, evolve_region, board, (0, 0, 1, 1), 1, "nil")
+
+    def test_zero_generations(self):
+        """Test that a copy of the window is returned for 0 generations."""
+        board = np.arange(20).reshape(4, 5) % 2
+
+        result = evolve_region(board, (1, 3, 2, 4), 0)
+
+        self.assert_array_equal(result, board[np.ix_([1, 2], [3, 4, 0, 1])])
+        self.assertEqual(result.dtype, np.uint8)
+
+        result = evolve_region(board, (1, 3, 2, 4), 0, "zeros")
+
+        self.assert_array_equal(result, [[0, 1, 0, 0], [1, 0, 0, 0]])
+
+    def test_matches_evolve_board(self):
+        """Test that the window is the same as in the evolved board, for\
+        windows inside the board, at its edges and past them, and when the\
+        whole board is evolved."""
+        rng = np.random.default_rng(5)
+        board = rng.integers(0, 2, (40, 30))
+        regions = [(15, 10, 5, 6), (0, 0, 4, 4), (36, 25, 4, 5), (-3, 27, 6, 7)]
+
+        for mode in ["wrap", "zeros"]:
+            for rule in ["B3/S23", "B36/S23", "B0/S8"]:
+                boards = [board] + list(evolve_board(board, 20, mode, rule=rule))
+                for region in regions:
+                    for generations in [1, 4, 12, 20]:
+                        with self.subTest(
+                            mode=mode, rule=rule, region=region, g=generations
+                        ):
+                            top, left, height, width = region
+                            if mode == "wrap":
+                                expected = np.roll(
+                                    boards[generations], (-top, -left), (0, 1)
+                                )[:height, :width]
+                            else:
+                                expected = np.pad(boards[generations], 10)[
+                                    top + 10 : top + 10 + height,
+                                    left + 10 : left + 10 + width,
+                                ]
+
+                            result = evolve_region(
+                                board, region, generations, mode, rule
+                            )
+
+                            self.assert_array_equal(result, expected)
+
+
+class TestCellDtype(BackendTestCase):
+    """
+    Tests for the one byte cells kept from validation to rendering.
+    """
+
+    # Peak of bytes allocated per cell while updating a board: the padded
+    # board, the field sums, the rule table index and the new board.
+    peak_bytes_per_cell = 4.5
+
+    def test_as_cells(self):
+        """Test that compact boards are not copied."""
+        board = np.eye(3, dtype=np.uint8)
+        self.assertIs(as_cells(board), board)
+
+        board = np.eye(3, dtype=bool)
+        self.assertIs(as_cells(board), board)
+
+        board = np.eye(3, dtype=np.int64)
+        self.assertEqual(as_cells(board).dtype, CELL_DTYPE)
+
+    def test_engines_dtype(self):
+        """Test that every engine yields one byte cells for int64 boards."""
+        board = np.random.default_rng(0).integers(0, 2, (8, 8))
+
+        boards = [update_board(board), jump_board(board, 3)]
+        boards += list(evolve_board(board, 2))
+        boards += list(evolve_board(board, 2, reuse_buffers=True))
+        boards += list(evolve_board(board, 2, workers=2))
+
+        for result in boards:
+            self.assertEqual(result.dtype, CELL_DTYPE)
+            self.assertEqual(result.nbytes, result.size)
+
+    def test_bool_boards(self):
+        """Test that bool boards stay bool."""
+        board = np.eye(4, dtype=bool)
+
+        self.assertEqual(update_board(board).dtype, bool)
+        for result in evolve_board(board, 2):
+            self.assertEqual(result.dtype, bool)
+
+    def test_update_board_footprint(self):
+        """Test the peak memory used per cell while updating a board."""
+        board = np.random.default_rng(1).integers(0, 2, (500, 500), dtype=np.uint8)
+        # The first update may compile the kernel of the backend.
+        update_board(board)
+
+        tracemalloc.start()
+        try:
+            update_board(board)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLessEqual(peak / board.size, self.peak_bytes_per_cell)
+
+
+# The tests of the engines also run with every other available backend.
+for _backend in available_backends():
+    if _backend == "numpy":
+        continue
+    for _case in [TestUpdateBoard, TestEvolveBoard, TestEvolveRegion, TestCellDtype]:
+        _name = "{}{}".format(_case.__name__, _backend.capitalize())
+        globals()[_name] = type(_name, (_case,), {"backend": _backend})
@@ -0,0 +1,121 @@
+"""
+Test suit for cycles.py file.
+"""
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+
+from ..core import evolve_board
+from ..cycles import CycleDetector, hash_board
+from .base_test import BaseTestCase, unittest
+
+
+def blinker():
+    board = np.zeros([5, 5], dtype=int)
+    board[2, 1:4] = 1
+    return board
+
+
+class TestHashBoard(BaseTestCase):
+    """
+    Tests for the hash_board function.
+    """
+
+    def test_shape_and_dtype(self):
+        """Test that boards with the same cells but other shape or dtype\
+        have different digests."""
+        board = np.zeros([2, 3], dtype=np.uint8)
+
+        self.assertEqual(hash_board(board), hash_board(board.copy()))
+        self.assertNotEqual(hash_board(board), hash_board(board.reshape(3, 2)))
+        self.assertNotEqual(hash_board(board), hash_board(board.astype(int)))
+
+
+class TestCycleDetector(BaseTestCase):
+    """
+    Tests for the CycleDetector class.
+    """
+
+    def test_exception_raising(self):
+        """Test for an unknown cycle behavior."""
+        self.assertRaises(TypeError, CycleDetector, 8, "nil")
+
+    def test_still_life(self):
+        """Test that a block is detected as a cycle of period 1."""
+        board = np.zeros([4, 4])
+        board[1:3, 1:3] = 1
+        detector = CycleDetector()
+
+        results = list(evolve_board(board, 10, cycle_detector=detector))
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(detector.period, 1)
+        self.assertEqual(detector.start, 0)
+
+    def test_oscillator_stop(self):
+        """Test that the evolution stops once the blinker repeats."""
+        detector = CycleDetector(on_cycle="stop")
+
+        results = list(evolve_board(blinker(), 10, cycle_detector=detector))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(detector.period, 2)
+        self.assertEqual(detector.start, 0)
+
+    def test_replay(self):
+        """Test that the replayed generations match the computed ones."""
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (6, 6))
+
+        for mode in ["wrap", "zeros"]:
+            detector = CycleDetector(on_cycle="replay")
+            expected_results = list(evolve_board(board, 60, mode))
+            results = list(evolve_board(board, 60, mode, cycle_detector=detector))
+
+            self.assertIsNotNone(detector.period)
+            self.assertEqual(len(results), len(expected_results))
+            for result, expected_result in zip(results, expected_results):
+                self.assert_array_equal(result, expected_result)
+
+    def test_history_limit(self):
+        """Test that cycles longer than the history are not detected."""
+        detector = CycleDetector(history=1)
+
+        results = list(evolve_board(blinker(), 10, cycle_detector=detector))
+
+        self.assertEqual(len(results), 10)
+        self.assertIsNone(detector.period)
+
+    def test_hash_collision(self):
+        """Test that boards with the same digest are not a cycle unless the\
+        board returns to itself."""
+        rng = np.random.default_rng(1)
+        board = rng.integers(0, 2, (16, 16))
+        expected_results = list(evolve_board(board, 5))
+
+        with mock.patch("game_of_pyfe.cycles.hash_board", return_value=b"key"):
+            detector = CycleDetector()
+            results = list(evolve_board(board, 5, cycle_detector=detector))
+
+        self.assertIsNone(detector.period)
+        for result, expected_result in zip(results, expected_results):
+            self.assert_array_equal(result, expected_result)
+
+    def test_memory(self):
+        """Test that only the digests of the recent boards are kept."""
+        board = np.random.default_rng(2).integers(0, 2, (500, 500), dtype=np.uint8)
+        iterator = evolve_board(
+            board, 20, reuse_buffers=True, cycle_detector=CycleDetector(history=64)
+        )
+        next(iterator)
+
+        tracemalloc.start()
+        try:
+            for _ in iterator:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak, board.nbytes)
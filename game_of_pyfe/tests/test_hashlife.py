@@ -0,0 +1,52 @@
+"""
+Test suit for hashlife.py file.
+"""
+import numpy as np
+
+from ..core import evolve_board
+from ..hashlife import HashLife
+from .base_test import BaseTestCase, unittest
+
+
+class TestHashLife(BaseTestCase):
+    """
+    Tests for the HashLife class.
+    """
+
+    def test_join_shares_nodes(self):
+        """Test that equal quadrants give the same node."""
+        universe = HashLife()
+        dead = universe.uniform(0, 1)
+
+        self.assertIs(universe.join(dead, dead, dead, dead), universe.uniform(0, 2))
+
+    def test_board_round_trip(self):
+        """Test that a board is recovered from its quadtree."""
+        universe = HashLife()
+        board = np.random.default_rng(0).integers(0, 2, (5, 7))
+
+        for mode in ["wrap", "zeros"]:
+            node = universe.from_board(board, 4, 0, mode)
+            self.assert_array_equal(universe.to_board(node, board.shape), board)
+
+    def test_step(self):
+        """Test that a step advances 2^j generations."""
+        universe = HashLife()
+        board = np.random.default_rng(1).integers(0, 2, (6, 6))
+
+        for mode in ["wrap", "zeros"]:
+            expected_result = list(evolve_board(board, 8, mode))[-1]
+            self.assert_array_equal(universe.step(board, 3, mode), expected_result)
+
+    def test_cache_limit(self):
+        """Test that the caches do not grow over the limit and the results\
+        stay correct."""
+        universe = HashLife(max_nodes=50)
+        board = np.random.default_rng(2).integers(0, 2, (12, 12))
+
+        expected_result = list(evolve_board(board, 16, "zeros"))[-1]
+        result = universe.step(board, 4, "zeros")
+
+        self.assert_array_equal(result, expected_result)
+        self.assertLessEqual(len(universe._nodes), 50)
+        self.assertLessEqual(len(universe._results), 50)
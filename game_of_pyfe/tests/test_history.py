@@ -0,0 +1,79 @@
+"""
+Test suit for history.py file.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from ..core import evolve_board
+from ..history import HistoryReader, HistoryWriter, write_history
+from .base_test import BaseTestCase, unittest
+
+
+class TestHistory(BaseTestCase):
+    """
+    Tests for the HistoryWriter and HistoryReader classes.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.hist")
+
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (17, 23))
+        self.boards = [board] + list(evolve_board(board, 40))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that every generation is decoded in order."""
+        n_generations = write_history(self.path, self.boards, keyframe_interval=8)
+
+        self.assertEqual(n_generations, len(self.boards))
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(len(reader), len(self.boards))
+            self.assertEqual(reader.shape, (17, 23))
+
+            results = list(reader)
+
+        for result, board in zip(results, self.boards):
+            self.assertEqual(result.dtype, np.uint8)
+            self.assert_array_equal(result, board)
+
+    def test_random_access(self):
+        """Test seeking backwards, forwards and across keyframes."""
+        write_history(self.path, self.boards, keyframe_interval=8)
+
+        with HistoryReader(self.path) as reader:
+            for generation in [37, 5, 6, 17, 16, 40, -1, 0]:
+                self.assert_array_equal(reader[generation], self.boards[generation])
+
+            self.assertRaises(IndexError, reader.__getitem__, 41)
+
+    def test_compression(self):
+        """Test that a still life takes a small fraction of the raw boards."""
+        board = np.zeros((64, 64))
+        board[10:12, 10:12] = 1
+
+        write_history(self.path, [board] * 200, keyframe_interval=64)
+
+        self.assertLess(os.path.getsize(self.path), 200 * board.size // 100)
+
+    def test_exception_raising(self):
+        """Test boards with other shapes and files that are not histories."""
+        with HistoryWriter(self.path) as writer:
+            writer.append(np.zeros([3, 3]))
+            self.assertRaises(ValueError, writer.append, np.zeros([3, 4]))
+
+        with open(self.path, "wb") as history_file:
+            history_file.write(b"not a history file")
+        self.assertRaises(ValueError, HistoryReader, self.path)
+
+    def test_empty_history(self):
+        """Test that a history without generations can be read."""
+        write_history(self.path, [])
+
+        with HistoryReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
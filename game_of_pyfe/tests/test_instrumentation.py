@@ -0,0 +1,178 @@
+"""
+Test suit for instrumentation.py file.
+"""
+import io
+import json
+from unittest import mock
+
+import numpy as np
+
+from .. import instrumentation
+from ..core import _apply_rule, _neighborhood_sum, _pad_board, evolve_board
+from ..cycles import CycleDetector
+from ..instrumentation import (
+    GenerationStats,
+    JsonLinesWriter,
+    MetricsRecorder,
+    board_stats,
+)
+from ..rules import HIGHLIFE
+from .base_test import BaseTestCase, unittest
+
+
+class TestObserver(BaseTestCase):
+    """
+    Tests for the observer of evolve_board.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.board = rng.integers(0, 2, (20, 30))
+
+    def assert_counts(self, metrics, boards):
+        """Check the population, births and deaths against the boards."""
+        self.assertEqual(len(metrics), len(boards) - 1)
+        for i, generation_metrics in enumerate(metrics):
+            previous, board = boards[i] != 0, boards[i + 1] != 0
+
+            self.assertEqual(generation_metrics["generation"], i + 1)
+            self.assertEqual(generation_metrics["population"], board.sum())
+            self.assertEqual(generation_metrics["births"], (board & ~previous).sum())
+            self.assertEqual(generation_metrics["deaths"], (previous & ~board).sum())
+            self.assertEqual(
+                generation_metrics["bounding_box"],
+                board_stats(board, board)["bounding_box"],
+            )
+
+    def test_metrics(self):
+        """Test the counts and timings of each generation, for both the\
+        copies and the reuse_buffers engines."""
+        for reuse_buffers in [False, True]:
+            with self.subTest(reuse_buffers=reuse_buffers):
+                recorder = MetricsRecorder()
+                boards = [self.board] + [
+                    board.copy()
+                    for board in evolve_board(
+                        self.board, 8, reuse_buffers=reuse_buffers, observer=recorder
+                    )
+                ]
+
+                self.assert_counts(recorder.metrics, boards)
+                for metrics in recorder.metrics:
+                    phases = sum(
+                        metrics[key]
+                        for key in ["pad_seconds", "rule_seconds", "copy_seconds"]
+                    )
+                    self.assertGreater(metrics["pad_seconds"], 0)
+                    self.assertGreater(metrics["rule_seconds"], 0)
+                    self.assertLessEqual(phases, metrics["seconds"])
+
+    def test_engine_stats(self):
+        """Test that the engines gather the statistics instead of counting\
+        them from the boards again."""
+        for reuse_buffers in [False, True]:
+            with self.subTest(reuse_buffers=reuse_buffers):
+                recorder = MetricsRecorder()
+                with mock.patch.object(instrumentation, "board_stats") as counted:
+                    list(
+                        evolve_board(
+                            self.board,
+                            4,
+                            reuse_buffers=reuse_buffers,
+                            observer=recorder,
+                        )
+                    )
+
+                counted.assert_not_called()
+                self.assertEqual(len(recorder.metrics), 4)
+
+    def test_boards_unchanged(self):
+        """Test that observing does not change the boards."""
+        expected_results = list(evolve_board(self.board, 5))
+        results = list(evolve_board(self.board, 5, observer=MetricsRecorder()))
+
+        for result, expected_result in zip(results, expected_results):
+            self.assert_array_equal(result, expected_result)
+
+    def test_parallel(self):
+        """Test that the parallel engine reports counts without phases, also\
+        when it reuses the buffers."""
+        for reuse_buffers in [False, True]:
+            with self.subTest(reuse_buffers=reuse_buffers):
+                recorder = MetricsRecorder()
+                boards = [self.board] + [
+                    board.copy()
+                    for board in evolve_board(
+                        self.board,
+                        4,
+                        "zeros",
+                        workers=3,
+                        reuse_buffers=reuse_buffers,
+                        observer=recorder,
+                    )
+                ]
+
+                self.assert_counts(recorder.metrics, boards)
+                self.assertIsNone(recorder.metrics[0]["pad_seconds"])
+
+    def test_replayed_cycle(self):
+        """Test that replayed generations spend no time in the phases."""
+        board = np.zeros([5, 5])
+        board[2, 1:4] = 1
+        recorder = MetricsRecorder()
+
+        boards = [board] + list(
+            evolve_board(
+                board,
+                6,
+                cycle_detector=CycleDetector(on_cycle="replay"),
+                observer=recorder,
+            )
+        )
+
+        self.assert_counts(recorder.metrics, boards)
+        self.assertEqual(recorder.metrics[-1]["rule_seconds"], 0)
+
+    def test_json_lines(self):
+        """Test that the metrics stream has a JSON object per line."""
+        stream = io.StringIO()
+
+        list(evolve_board(self.board, 4, observer=JsonLinesWriter(stream)))
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(
+            [json.loads(line)["generation"] for line in lines], [1, 2, 3, 4]
+        )
+
+
+class TestGenerationStats(BaseTestCase):
+    """
+    Tests for the GenerationStats class and the board_stats function.
+    """
+
+    def test_matches_board_stats(self):
+        """Test that the statistics gathered in the rule lookup are the\
+        counted ones, for chunks of one and of many rows."""
+        rng = np.random.default_rng(1)
+        for shape in [(40, 1000), (3, 20000), (6, 7)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = rng.integers(0, 2, shape).astype(np.uint8)
+                    stats = GenerationStats(shape, HIGHLIFE)
+
+                    stats.start()
+                    total = _neighborhood_sum(_pad_board(board, mode))
+                    new_board = _apply_rule(board, total, HIGHLIFE, stats=stats)
+
+                    self.assertTrue(stats.ready)
+                    self.assertEqual(stats.read(), board_stats(board, new_board))
+                    self.assertFalse(stats.ready)
+
+    def test_bounding_box(self):
+        """Test the box of the living cells and of an empty board."""
+        board = np.zeros((6, 8))
+        board[1, 5] = board[4, 2] = 1
+
+        self.assertEqual(board_stats(board, board)["bounding_box"], [1, 2, 4, 5])
+        self.assertIsNone(board_stats(board, np.zeros((6, 8)))["bounding_box"])
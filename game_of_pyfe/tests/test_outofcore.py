@@ -0,0 +1,103 @@
+"""
+Test suit for outofcore.py file.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from ..core import evolve_board, update_board
+from ..outofcore import evolve_npy_file, update_board_file
+from .base_test import BaseTestCase, unittest
+
+
+class TestUpdateBoardFile(BaseTestCase):
+    """
+    Tests for the update_board_file function.
+    """
+
+    def test_exception_raising(self):
+        """Test when the board is too small or the mode does not exist."""
+        board = np.zeros([1, 3])
+        self.assertRaises(AssertionError, update_board_file, board, board.copy())
+
+        board = np.zeros([3, 3])
+        self.assertRaises(TypeError, update_board_file, board, board.copy(), "nil")
+
+    def test_matches_update_board(self):
+        """Test that the bands are updated as the whole board, for bands\
+        that do not divide the number of rows."""
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (11, 9))
+
+        for mode in ["wrap", "zeros"]:
+            for band_rows in [1, 2, 4, 11, 20]:
+                with self.subTest(mode=mode, band_rows=band_rows):
+                    result = np.empty(board.shape, dtype=np.uint8)
+                    update_board_file(board, result, mode, band_rows=band_rows)
+
+                    self.assert_array_equal(result, update_board(board, mode))
+
+
+class TestEvolveNpyFile(BaseTestCase):
+    """
+    Tests for the evolve_npy_file function.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "board.npy")
+        self.destination = os.path.join(self.directory.name, "result.npy")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_evolve_board(self):
+        """Test that the last generation is the same as evolve_board, for\
+        even and odd numbers of generations."""
+        rng = np.random.default_rng(1)
+        board = rng.integers(0, 2, (13, 10))
+        np.save(self.source, board)
+
+        for mode in ["wrap", "zeros"]:
+            for n_times in [1, 4, 5]:
+                with self.subTest(mode=mode, n_times=n_times):
+                    evolve_npy_file(
+                        self.source, self.destination, n_times, mode, band_rows=3
+                    )
+                    *_, expected_result = evolve_board(board, n_times, mode)
+
+                    result = np.load(self.destination)
+                    self.assertEqual(result.dtype, np.uint8)
+                    self.assert_array_equal(result, expected_result)
+
+        # Only the source and the result remain in the directory.
+        self.assertEqual(
+            sorted(os.listdir(self.directory.name)), ["board.npy", "result.npy"]
+        )
+
+    def test_zero_generations(self):
+        """Test that evolving 0 generations copies the board."""
+        board = np.eye(5, dtype=np.int64)
+        np.save(self.source, board)
+
+        evolve_npy_file(self.source, self.destination, 0, band_rows=2)
+
+        self.assert_array_equal(np.load(self.destination), board)
+
+    def test_in_place(self):
+        """Test that a board file can be evolved in place."""
+        board = np.zeros([5, 5], dtype=np.int64)
+        board[2, 1:4] = 1
+        np.save(self.source, board)
+
+        for generations in [0, 1, 2]:
+            with self.subTest(generations=generations):
+                expected_result = np.load(self.source)
+                for expected_result in evolve_board(expected_result, generations):
+                    pass
+
+                evolve_npy_file(self.source, self.source, generations, band_rows=2)
+
+                self.assert_array_equal(np.load(self.source), expected_result)
+                self.assertEqual(os.listdir(self.directory.name), ["board.npy"])
@@ -0,0 +1,91 @@
+"""
+Test suit for packed.py file.
+"""
+import numpy as np
+
+from ..core import evolve_board, update_board
+from ..packed import evolve_packed_board, pack_board, unpack_board, update_packed_board
+from .base_test import BaseTestCase, unittest
+
+
+class TestPackBoard(BaseTestCase):
+    """
+    Tests for the pack_board and unpack_board functions.
+    """
+
+    def test_round_trip(self):
+        """Test that unpacking a packed board returns the original board."""
+        rng = np.random.default_rng(0)
+        for shape in [(2, 2), (3, 64), (4, 65), (5, 130)]:
+            board = rng.integers(0, 2, shape)
+
+            packed = pack_board(board)
+
+            self.assertEqual(packed.dtype, np.uint64)
+            self.assertEqual(packed.shape, (shape[0], -(-shape[1] // 64)))
+            self.assert_array_equal(unpack_board(packed, shape), board)
+
+    def test_bit_layout(self):
+        """Test that cell j is stored in bit j of the row words."""
+        board = np.zeros((2, 66))
+        board[0, 0] = 1
+        board[1, 65] = 1
+
+        packed = pack_board(board)
+
+        self.assertEqual(int(packed[0, 0]), 1)
+        self.assertEqual(int(packed[0, 1]), 0)
+        self.assertEqual(int(packed[1, 0]), 0)
+        self.assertEqual(int(packed[1, 1]), 2)
+
+
+class TestUpdatePackedBoard(BaseTestCase):
+    """
+    Tests for the update_packed_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when the mode does not exist."""
+        packed = pack_board(np.zeros([2, 2]))
+        self.assertRaises(TypeError, update_packed_board, packed, 2, "nil")
+
+    def test_matches_update_board(self):
+        """Test that the packed board evolves as the unpacked board,\
+        including boards whose rows do not fill the last word."""
+        rng = np.random.default_rng(1)
+        for shape in [(2, 2), (5, 7), (6, 64), (9, 65), (7, 128)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = rng.integers(0, 2, shape)
+                    packed = pack_board(board)
+
+                    for _ in range(4):
+                        board = update_board(board, mode)
+                        packed = update_packed_board(packed, shape[1], mode)
+
+                        self.assert_array_equal(unpack_board(packed, shape), board)
+
+
+class TestEvolvePackedBoard(BaseTestCase):
+    """
+    Tests for the evolve_packed_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis."""
+        board = np.zeros([1, 1])
+        iterator = evolve_packed_board(board, 1)
+        self.assertRaises(AssertionError, iterator.__next__)
+
+    def test_matches_evolve_board(self):
+        """Test that the generations are the same as evolve_board."""
+        rng = np.random.default_rng(2)
+        board = rng.integers(0, 2, (10, 70))
+
+        for mode in ["wrap", "zeros"]:
+            expected_results = list(evolve_board(board, 5, mode))
+            results = list(evolve_packed_board(board, 5, mode))
+
+            self.assertEqual(len(results), len(expected_results))
+            for result, expected_result in zip(results, expected_results):
+                self.assert_array_equal(result, expected_result)
@@ -0,0 +1,89 @@
+"""
+Test suit for parallel.py file.
+"""
+import numpy as np
+
+from ..core import evolve_board, update_board
+from ..parallel import _strips, evolve_parallel_board
+from .base_test import BaseTestCase, unittest
+
+
+class TestStrips(BaseTestCase):
+    """
+    Tests for the _strips function.
+    """
+
+    def test_cover_rows(self):
+        """Test that the strips cover every row once."""
+        self.assertEqual(_strips(10, 3), [(0, 3), (3, 6), (6, 10)])
+        self.assertEqual(_strips(2, 4), [(0, 1), (1, 2)])
+
+
+class TestEvolveParallelBoard(BaseTestCase):
+    """
+    Tests for the evolve_parallel_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis or the\
+        mode does not exist."""
+        board = np.zeros([1, 1])
+        iterator = evolve_parallel_board(board, 1)
+        self.assertRaises(AssertionError, iterator.__next__)
+
+        board = np.zeros([2, 2])
+        iterator = evolve_parallel_board(board, 1, "nil")
+        self.assertRaises(TypeError, iterator.__next__)
+
+    def test_matches_evolve_board(self):
+        """Test that the generations are the same as evolve_board, with\
+        strips of a single row."""
+        rng = np.random.default_rng(0)
+        for shape in [(2, 2), (5, 7), (17, 11)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = rng.integers(0, 2, shape)
+
+                    expected_results = list(evolve_board(board, 4, mode))
+                    results = list(evolve_parallel_board(board, 4, mode, 3))
+
+                    self.assertEqual(len(results), len(expected_results))
+                    for result, expected_result in zip(results, expected_results):
+                        self.assert_array_equal(result, expected_result)
+
+    def test_early_close(self):
+        """Test that closing the generator releases the shared memory."""
+        board = np.eye(4)
+        iterator = evolve_parallel_board(board, 10, "wrap", 2)
+
+        self.assert_array_equal(next(iterator), update_board(board))
+        iterator.close()
+
+    def test_reuse_buffers(self):
+        """Test that reusing the buffers yields the same generations as\
+        read-only views of two boards."""
+        board = np.random.default_rng(1).integers(0, 2, (9, 8))
+
+        for mode in ["wrap", "zeros"]:
+            with self.subTest(mode=mode):
+                expected_results = evolve_board(board, 5, mode)
+                results = evolve_board(board, 5, mode, workers=2, reuse_buffers=True)
+
+                bases = set()
+                for result, expected_result in zip(results, expected_results):
+                    self.assert_array_equal(result, expected_result)
+                    self.assertFalse(result.flags.writeable)
+                    bases.add(id(result.base))
+                self.assertEqual(len(bases), 2)
+
+    def test_backend(self):
+        """Test that the backend is given to the workers."""
+        board = np.random.default_rng(2).integers(0, 2, (7, 7))
+
+        iterator = evolve_parallel_board(board, 1, backend="nil")
+        self.assertRaises(TypeError, iterator.__next__)
+
+        expected_results = evolve_board(board, 3, "zeros")
+        results = evolve_board(board, 3, "zeros", workers=2, backend="numpy")
+        for result, expected_result in zip(results, expected_results):
+            self.assert_array_equal(result, expected_result)
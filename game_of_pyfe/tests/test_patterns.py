@@ -0,0 +1,154 @@
+"""
+Test suit for patterns.py file.
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from ..patterns import (
+    read_cells,
+    read_life_106,
+    read_pattern,
+    read_rle,
+    write_life_106,
+    write_pattern,
+    write_rle,
+)
+from .base_test import BaseTestCase, unittest
+
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
+
+
+class PatternTestCase(BaseTestCase):
+    """
+    Test case with a temporary directory for the pattern files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_file(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as pattern_file:
+            pattern_file.write(content)
+
+        return path
+
+
+class TestReadPattern(PatternTestCase):
+    """
+    Tests for the pattern file readers.
+    """
+
+    def test_read_rle(self):
+        """Test reading a glider with comments and a run split in lines."""
+        path = self.write_file(
+            "glider.rle",
+            "#N Glider\n#C A comment\nx = 5, y = 4, rule = B3/S23\nbo$2bo$\n3o!\n",
+        )
+
+        board = read_rle(path)
+
+        self.assertEqual(board.dtype, np.uint8)
+        expected_board = np.zeros((4, 5))
+        expected_board[:3, :3] = GLIDER
+        self.assert_array_equal(board, expected_board)
+
+    def test_read_rle_empty_rows(self):
+        """Test that a count before $ skips rows."""
+        path = self.write_file("rows.rle", "x = 2, y = 4\no3$bo!\n")
+
+        self.assert_array_equal(read_rle(path), [[1, 0], [0, 0], [0, 0], [0, 1]])
+
+    def test_read_cells(self):
+        """Test reading a glider with comments and short rows."""
+        path = self.write_file("glider.cells", "!Name: Glider\n.O\n..O\nOOO\n")
+
+        board = read_cells(path)
+
+        self.assertEqual(board.dtype, np.uint8)
+        self.assert_array_equal(board, GLIDER)
+
+    def test_read_life_106(self):
+        """Test reading a glider with negative coordinates."""
+        path = self.write_file("glider.lif", "#Life 1.06\n0 -1\n1 0\n-1 1\n0 1\n1 1\n")
+
+        board = read_life_106(path)
+
+        self.assertEqual(board.dtype, np.uint8)
+        self.assert_array_equal(board, GLIDER)
+
+    def test_exception_raising(self):
+        """Test invalid files and extensions."""
+        self.assertRaises(ValueError, read_pattern, "glider.json")
+
+        path = self.write_file("header.rle", "bo$2bo$3o!\n")
+        self.assertRaises(ValueError, read_rle, path)
+
+        path = self.write_file("outside.rle", "x = 2, y = 2\n3o!\n")
+        self.assertRaises(ValueError, read_rle, path)
+
+        path = self.write_file("tag.rle", "x = 2, y = 2\nA!\n")
+        self.assertRaises(ValueError, read_rle, path)
+
+        path = self.write_file("invalid.cells", ".O\nX.\n")
+        self.assertRaises(ValueError, read_cells, path)
+
+        path = self.write_file("invalid.lif", "#Life 1.06\n1 2 3\n")
+        self.assertRaises(ValueError, read_life_106, path)
+
+
+class TestWritePattern(PatternTestCase):
+    """
+    Tests for the pattern file writers.
+    """
+
+    def test_write_rle(self):
+        """Test the runs of a glider with trailing dead cells and rows."""
+        board = np.zeros((4, 5))
+        board[:3, :3] = GLIDER
+        path = os.path.join(self.directory.name, "glider.rle")
+
+        write_rle(board, path)
+
+        with open(path) as pattern_file:
+            self.assertEqual(
+                pattern_file.read(), "x = 5, y = 4, rule = B3/S23\nbo$2bo$3o!\n"
+            )
+
+    def test_round_trip(self):
+        """Test that reading a written board returns the board, including\
+        RLE lines longer than the line length."""
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (20, 150))
+
+        for extension in [".rle", ".cells", ".lif", ".life"]:
+            with self.subTest(extension=extension):
+                path = os.path.join(self.directory.name, "board" + extension)
+
+                write_pattern(board, path)
+
+                self.assert_array_equal(read_pattern(path), board)
+
+        with open(os.path.join(self.directory.name, "board.rle")) as pattern_file:
+            for line in pattern_file:
+                self.assertLessEqual(len(line.rstrip("\n")), 70)
+
+    def test_life_106_size(self):
+        """Test that Life 1.06 files keep the dead border and the empty boards."""
+        board = np.zeros((6, 7), dtype=np.uint8)
+        board[2:5, 3:6] = GLIDER
+        path = os.path.join(self.directory.name, "board.lif")
+
+        for expected_board in [board, np.zeros_like(board)]:
+            with self.subTest(population=int(expected_board.sum())):
+                write_life_106(expected_board, path)
+
+                self.assert_array_equal(read_life_106(path), expected_board)
+
+        path = self.write_file("outside.lif", "#Life 1.06\n#D size 2 2\n2 0\n")
+        self.assertRaises(ValueError, read_life_106, path)
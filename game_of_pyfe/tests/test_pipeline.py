@@ -0,0 +1,81 @@
+"""
+Test suit for pipeline.py file.
+"""
+import threading
+import time
+
+import numpy as np
+
+from ..core import evolve_board
+from ..pipeline import FramePipeline
+from .base_test import BaseTestCase, unittest
+
+
+class TestFramePipeline(BaseTestCase):
+    """
+    Tests for the FramePipeline class.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.board = rng.integers(0, 2, (16, 16))
+
+    def test_every_frame(self):
+        """Test that without dropping every board is yielded in order,\
+        including the read-only boards of reuse_buffers."""
+        expected_results = list(evolve_board(self.board, 30))
+        boards = evolve_board(self.board, 30, reuse_buffers=True)
+
+        results = list(FramePipeline(boards, max_frames=2))
+
+        self.assertEqual([generation for generation, _ in results], list(range(30)))
+        for (_, result), expected_result in zip(results, expected_results):
+            self.assert_array_equal(result, expected_result)
+
+    def test_drop_frames(self):
+        """Test that a slow renderer skips boards but shows the last one."""
+        expected_results = list(evolve_board(self.board, 200))
+        pipeline = FramePipeline(
+            evolve_board(self.board, 200), max_frames=2, drop_frames=True
+        )
+
+        generations = []
+        for generation, board in pipeline:
+            self.assert_array_equal(board, expected_results[generation])
+            generations.append(generation)
+            time.sleep(0.005)
+
+        self.assertEqual(generations[-1], 199)
+        self.assertEqual(generations, sorted(set(generations)))
+        self.assertGreater(pipeline.dropped, 0)
+        self.assertEqual(len(generations) + pipeline.dropped, 200)
+
+    def test_target_fps(self):
+        """Test that the frames are spaced by the frame rate."""
+        start = time.monotonic()
+        list(FramePipeline(evolve_board(self.board, 6), fps=50))
+
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50)
+
+    def test_exception_raising(self):
+        """Test that the errors of the computation reach the renderer."""
+        board = np.zeros([1, 1])
+        self.assertRaises(AssertionError, list, FramePipeline(evolve_board(board, 2)))
+
+    def test_close(self):
+        """Test that stopping the iteration stops the background thread."""
+        produced = []
+
+        def boards():
+            for i in range(1000):
+                produced.append(i)
+                yield self.board
+
+        pipeline = FramePipeline(boards(), max_frames=1)
+        for generation, _ in pipeline:
+            if generation == 3:
+                break
+        pipeline.close()
+
+        self.assertLess(len(produced), 1000)
+        self.assertNotIn(pipeline._thread, threading.enumerate())
@@ -0,0 +1,129 @@
+"""
+Test suit for render.py file.
+"""
+import io
+import re
+
+import numpy as np
+
+from ..core import evolve_board
+from ..render import TerminalRenderer
+from ..viewport import Viewport
+from .base_test import BaseTestCase, unittest
+
+_ESCAPE = re.compile(r"\x1b\[(\??)([0-9;]*)([A-Za-z])")
+
+
+class Terminal:
+    """
+    Minimal ANSI terminal that applies the output of the renderer.
+    """
+
+    def __init__(self, n_rows: int, n_columns: int):
+        self.screen = [[" "] * n_columns for _ in range(n_rows)]
+        self.row, self.column = 0, 0
+
+    def write(self, text: str) -> None:
+        position = 0
+        for match in _ESCAPE.finditer(text):
+            self.put(text[position : match.start()])
+            position = match.end()
+
+            private, arguments, command = match.groups()
+            if private:
+                continue
+            if command == "H":
+                row, column = (arguments or "1;1").split(";")
+                self.row, self.column = int(row) - 1, int(column) - 1
+            elif command == "J":
+                self.screen = [[" "] * len(line) for line in self.screen]
+            elif command == "K":
+                self.screen[self.row][self.column :] = " " * (
+                    len(self.screen[self.row]) - self.column
+                )
+        self.put(text[position:])
+
+    def put(self, text: str) -> None:
+        for character in text:
+            if character == "\n":
+                self.row, self.column = self.row + 1, 0
+            else:
+                self.screen[self.row][self.column] = character
+                self.column += 1
+
+    def lines(self, start: int, stop: int):
+        return ["".join(line) for line in self.screen[start:stop]]
+
+
+class TestTerminalRenderer(BaseTestCase):
+    """
+    Tests for the TerminalRenderer class.
+    """
+
+    def test_screen_matches_boards(self):
+        """Test that the terminal shows each board after the differences."""
+        rng = np.random.default_rng(0)
+        board = rng.integers(0, 2, (12, 15))
+        terminal = Terminal(14, 20)
+        renderer = TerminalRenderer(io.StringIO())
+
+        boards = [board] + list(evolve_board(board, 10))
+        for generation, next_board in enumerate(boards):
+            stream = io.StringIO()
+            renderer.stream = stream
+            renderer.render(next_board, generation)
+            terminal.write(stream.getvalue())
+
+            self.assertEqual(
+                terminal.lines(0, 1)[0].rstrip(), "Generation: {}".format(generation)
+            )
+            expected_lines = [
+                "".join("█" if cell else " " for cell in row).ljust(20)
+                for row in next_board
+            ]
+            self.assertEqual(terminal.lines(1, 13), expected_lines)
+
+    def test_writes_changed_cells(self):
+        """Test that only the changed cells are written after the first\
+        board, in a single write."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        board = np.zeros((50, 50))
+
+        renderer.render(board, 0)
+        first_frame = stream.getvalue()
+        self.assertIn("\x1b[2J", first_frame)
+
+        board[10, 20:23] = 1
+        stream.seek(0)
+        stream.truncate()
+        renderer.render(board, 1)
+
+        frame = stream.getvalue()
+        self.assertNotIn("\x1b[2J", frame)
+        self.assertIn("\x1b[12;21H███", frame)
+        self.assertLess(len(frame), len(first_frame) // 50)
+
+    def test_shape_change(self):
+        """Test that a board with a new shape is drawn again."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+
+        renderer.render(np.zeros((3, 3)), 0)
+        stream.seek(0)
+        stream.truncate()
+        renderer.render(np.ones((4, 4)), 1)
+
+        self.assertIn("\x1b[2J", stream.getvalue())
+        self.assertIn("████\n████\n", stream.getvalue())
+
+    def test_viewport(self):
+        """Test that with a viewport only the window is drawn."""
+        stream = io.StringIO()
+        board = np.zeros((400, 400))
+        board[1, 1] = 1
+        renderer = TerminalRenderer(stream, viewport=Viewport(2, 3, style="braille"))
+
+        renderer.render(board, 0)
+
+        self.assertIn("\x1b[2;1H⠐⠀⠀\n⠀⠀⠀\n", stream.getvalue())
@@ -0,0 +1,117 @@
+"""
+Test suit for rules.py file.
+"""
+import numpy as np
+
+from ..batch import evolve_boards
+from ..core import evolve_board, generate_fields, jump_board, update_board, update_cell
+from ..packed import evolve_packed_board
+from ..rules import CONWAY, DAY_AND_NIGHT, HIGHLIFE, Rule, parse_rule
+from ..sparse import evolve_sparse_board, update_cells
+from ..tiled import evolve_tiled_board
+from .base_test import BaseTestCase, unittest
+
+
+class TestRule(BaseTestCase):
+    """
+    Tests for the Rule class.
+    """
+
+    def test_exception_raising(self):
+        """Test for notations that are not B/S."""
+        self.assertRaises(ValueError, Rule, "B9/S23")
+        self.assertRaises(ValueError, Rule, "B3S23")
+        self.assertRaises(ValueError, Rule, "23/3")
+
+    def test_notation(self):
+        """Test the parsing of the notation."""
+        rule = Rule("b36/s23")
+
+        self.assertEqual(rule.birth, {3, 6})
+        self.assertEqual(rule.survival, {2, 3})
+        self.assertEqual(str(rule), "B36/S23")
+        self.assertEqual(rule, HIGHLIFE)
+        self.assertEqual(Rule("S23/B3"), CONWAY)
+        self.assertEqual(str(Rule("B/S")), "B/S")
+
+    def test_table(self):
+        """Test the lookup table of Conway's rule, indexed by the field sum\
+        plus 10 for living cells."""
+        expected_result = np.zeros(20, dtype=np.uint8)
+        expected_result[3] = 1
+        expected_result[13] = 1
+        expected_result[14] = 1
+
+        self.assert_array_equal(CONWAY.table, expected_result)
+
+    def test_parse_rule(self):
+        """Test that rules are kept and notations are parsed."""
+        self.assertIs(parse_rule(CONWAY), CONWAY)
+        self.assertEqual(parse_rule("B3678/S34678"), DAY_AND_NIGHT)
+
+
+class TestRuleEngines(BaseTestCase):
+    """
+    Tests that every engine applies the same rule.
+    """
+
+    def test_update_cell(self):
+        """Test the rule of a single cell against its definition."""
+        rng = np.random.default_rng(0)
+        for rule in [HIGHLIFE, DAY_AND_NIGHT]:
+            for field in rng.integers(0, 2, (50, 3, 3)):
+                neighbors = field.sum() - field[1, 1]
+                counts = rule.survival if field[1, 1] else rule.birth
+
+                self.assertEqual(update_cell(field, rule), int(neighbors in counts))
+
+    def test_update_board(self):
+        """Test that the whole board update matches update_cell."""
+        rng = np.random.default_rng(1)
+        board = rng.integers(0, 2, (8, 9))
+        for mode in ["wrap", "zeros"]:
+            fields = generate_fields(board, mode)
+            expected_result = np.array(
+                [[update_cell(field, "B36/S23") for field in row] for row in fields]
+            )
+
+            self.assert_array_equal(
+                update_board(board, mode, "B36/S23"), expected_result
+            )
+
+    def test_engines(self):
+        """Test that every engine matches evolve_board."""
+        rng = np.random.default_rng(2)
+        board = rng.integers(0, 2, (12, 10))
+
+        for rule in [HIGHLIFE, DAY_AND_NIGHT]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(rule=rule, mode=mode):
+                    expected_results = list(evolve_board(board, 8, mode, rule=rule))
+
+                    results = {
+                        "buffers": evolve_board(
+                            board, 8, mode, reuse_buffers=True, rule=rule
+                        ),
+                        "workers": evolve_board(board, 8, mode, workers=2, rule=rule),
+                        "batch": (
+                            b[0] for b in evolve_boards(board[None], 8, mode, rule)
+                        ),
+                        "packed": evolve_packed_board(board, 8, mode, rule),
+                        "sparse": evolve_sparse_board(board, 8, mode, rule),
+                        "tiled": (
+                            b for b, _ in evolve_tiled_board(board, 8, mode, 4, rule)
+                        ),
+                    }
+
+                    for engine, boards in results.items():
+                        for result, expected_result in zip(boards, expected_results):
+                            self.assert_array_equal(result, expected_result)
+
+                    result = jump_board(board, 8, mode, rule=rule)
+                    self.assert_array_equal(result, expected_results[-1])
+
+    def test_sparse_birth_without_neighbors(self):
+        """Test that the sparse engine rejects B0 rules."""
+        cells = np.zeros((0, 2), dtype=int)
+        self.assertRaises(ValueError, update_cells, cells, (3, 3), "wrap", "B0/S")
@@ -0,0 +1,82 @@
+"""
+Test suit for sparse.py file.
+"""
+import numpy as np
+
+from ..core import CELL_DTYPE, evolve_board, update_board
+from ..sparse import board_to_cells, cells_to_board, evolve_sparse_board, update_cells
+from .base_test import BaseTestCase, unittest
+
+
+class TestCells(BaseTestCase):
+    """
+    Tests for the board_to_cells and cells_to_board functions.
+    """
+
+    def test_round_trip(self):
+        """Test that a board is recovered from its living cells."""
+        board = np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]])
+
+        cells = board_to_cells(board)
+
+        self.assert_array_equal(cells, np.array([[0, 1], [1, 2], [2, 0]]))
+        self.assert_array_equal(cells_to_board(cells, board.shape), board)
+
+
+class TestUpdateCells(BaseTestCase):
+    """
+    Tests for the update_cells function.
+    """
+
+    def test_exception_raising(self):
+        """Test when the mode does not exist."""
+        cells = board_to_cells(np.eye(3))
+        self.assertRaises(TypeError, update_cells, cells, (3, 3), "nil")
+
+    def test_empty_board(self):
+        """Test that an empty board stays empty."""
+        cells = board_to_cells(np.zeros([4, 4]))
+
+        result = update_cells(cells, (4, 4))
+
+        self.assertEqual(result.shape, (0, 2))
+
+    def test_matches_update_board(self):
+        """Test that the living cells evolve as the dense board."""
+        rng = np.random.default_rng(0)
+        for shape in [(2, 2), (5, 7), (20, 13)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = (rng.random(shape) < 0.3).astype(int)
+                    cells = board_to_cells(board)
+
+                    for _ in range(5):
+                        board = update_board(board, mode)
+                        cells = update_cells(cells, shape, mode)
+
+                        self.assert_array_equal(cells_to_board(cells, shape), board)
+
+
+class TestEvolveSparseBoard(BaseTestCase):
+    """
+    Tests for the evolve_sparse_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis."""
+        board = np.zeros([1, 1])
+        iterator = evolve_sparse_board(board, 1)
+        self.assertRaises(AssertionError, iterator.__next__)
+
+    def test_matches_evolve_board(self):
+        """Test that the generations are the same as evolve_board."""
+        board = np.zeros([30, 30], dtype=int)
+        board[0, 1] = board[1, 2] = board[2, 0] = board[2, 1] = board[2, 2] = 1
+
+        for mode in ["wrap", "zeros"]:
+            expected_results = list(evolve_board(board, 40, mode))
+            results = list(evolve_sparse_board(board, 40, mode))
+
+            for result, expected_result in zip(results, expected_results):
+                self.assert_array_equal(result, expected_result)
+                self.assertEqual(result.dtype, CELL_DTYPE)
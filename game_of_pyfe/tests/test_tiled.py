@@ -0,0 +1,106 @@
+"""
+Test suit for tiled.py file.
+"""
+import numpy as np
+
+from ..core import evolve_board
+from ..tiled import evolve_tiled_board, grow_tiles, update_tiled_board
+from .base_test import BaseTestCase, unittest
+
+
+class TestGrowTiles(BaseTestCase):
+    """
+    Tests for the grow_tiles function.
+    """
+
+    def test_modes(self):
+        """Test the growth of a tile in the corner for both edge modes."""
+        tiles = np.zeros([4, 4], dtype=bool)
+        tiles[0, 0] = True
+
+        expected_result = np.array(
+            [
+                [1, 1, 0, 1],
+                [1, 1, 0, 1],
+                [0, 0, 0, 0],
+                [1, 1, 0, 1],
+            ],
+            dtype=bool,
+        )
+        self.assert_array_equal(grow_tiles(tiles, "wrap"), expected_result)
+
+        expected_result = np.array(
+            [
+                [1, 1, 0, 0],
+                [1, 1, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+            ],
+            dtype=bool,
+        )
+        self.assert_array_equal(grow_tiles(tiles, "zeros"), expected_result)
+
+        self.assertRaises(TypeError, grow_tiles, tiles, "nil")
+
+
+class TestUpdateTiledBoard(BaseTestCase):
+    """
+    Tests for the update_tiled_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when the mode does not exist."""
+        board = np.zeros([4, 4])
+        tiles = np.ones([2, 2], dtype=bool)
+        self.assertRaises(TypeError, update_tiled_board, board, tiles, "nil", 2)
+
+    def test_inactive_tiles(self):
+        """Test that the tiles that are not active are not recomputed."""
+        board = np.zeros([4, 4], dtype=int)
+        board[1, 0:3] = 1
+        tiles = np.zeros([2, 2], dtype=bool)
+
+        result, changed_tiles = update_tiled_board(board, tiles, "wrap", 2)
+
+        self.assert_array_equal(result, board)
+        self.assertFalse(changed_tiles.any())
+
+
+class TestEvolveTiledBoard(BaseTestCase):
+    """
+    Tests for the evolve_tiled_board function.
+    """
+
+    def test_exception_raising(self):
+        """Test when board is smaller than 2 in any of the axis."""
+        board = np.zeros([1, 1])
+        iterator = evolve_tiled_board(board, 1)
+        self.assertRaises(AssertionError, iterator.__next__)
+
+    def test_matches_evolve_board(self):
+        """Test that the generations are the same as evolve_board, including\
+        tiles that do not fit the board."""
+        rng = np.random.default_rng(0)
+        for shape in [(5, 7), (16, 16), (23, 17)]:
+            for mode in ["wrap", "zeros"]:
+                with self.subTest(shape=shape, mode=mode):
+                    board = rng.integers(0, 2, shape)
+
+                    expected_results = list(evolve_board(board, 30, mode))
+                    results = list(evolve_tiled_board(board, 30, mode, 4))
+
+                    self.assertEqual(len(results), len(expected_results))
+                    for (result, _), expected_result in zip(results, expected_results):
+                        self.assert_array_equal(result, expected_result)
+
+    def test_active_tiles(self):
+        """Test that only the tiles around a blinker are recomputed once\
+        the rest of the board is stable."""
+        board = np.zeros([16, 16], dtype=int)
+        board[1, 0:3] = 1
+
+        active_tiles = [
+            active for _, active in evolve_tiled_board(board, 3, "zeros", 4)
+        ]
+
+        self.assertEqual(active_tiles, [16, 4, 4])
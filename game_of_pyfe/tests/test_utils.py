@@ -51,6 +51,39 @@ def test_values_board(self):
         result = validate_board(board)
         self.assert_array_equal(result, board)
 
+        board = np.zeros([2, 2])
+        board[1, 0] = 0.5
+        self.assertRaises(ValueError, validate_board, board)
+
+        board = np.zeros([2, 2])
+        board[0, 1] = np.nan
+        self.assertRaises(ValueError, validate_board, board)
+
+    def test_first_invalid_index(self):
+        """Test that the error reports the first invalid value."""
+        board = np.zeros([3, 4], dtype=np.int8)
+        board[1, 2] = -1
+        board[2, 0] = 5
+
+        with self.assertRaises(ValueError) as context:
+            validate_board(board)
+
+        self.assertEqual(str(context.exception), "Board contains a -1 in index [1, 2]")
+
+    def test_compact_dtype(self):
+        """Test that the board is returned as uint8 and that compact boards\
+        are not copied."""
+        board = np.eye(3, dtype=np.int64)
+        result = validate_board(board)
+        self.assertEqual(result.dtype, np.uint8)
+        self.assert_array_equal(result, board)
+
+        board = np.eye(3, dtype=np.uint8)
+        self.assertIs(validate_board(board), board)
+
+        board = np.eye(3, dtype=bool)
+        self.assertIs(validate_board(board), board)
+
 
 class TestCreatePrintableBoard(BaseTestCase):
     """
@@ -77,3 +110,6 @@ def test_base_board(self):
         ]
         result = create_printable_board(board)
         self.assertCountEqual(result, expected_result)
+
+        result = create_printable_board(validate_board(board))
+        self.assertCountEqual(result, expected_result)
@@ -0,0 +1,110 @@
+"""
+Test suit for viewport.py file.
+"""
+import numpy as np
+
+from ..viewport import Viewport, downsample, to_glyphs
+from .base_test import BaseTestCase, unittest
+
+
+class TestDownsample(BaseTestCase):
+    """
+    Tests for the downsample function.
+    """
+
+    def test_any_living_cell(self):
+        """Test that by default a block with a living cell is alive,\
+        including the incomplete blocks of the edges."""
+        board = np.zeros((5, 5))
+        board[0, 1] = 1
+        board[4, 4] = 1
+
+        self.assert_array_equal(downsample(board, 2), [[1, 0, 0], [0, 0, 0], [0, 0, 1]])
+
+    def test_min_density(self):
+        """Test that only the blocks above the density are alive."""
+        board = np.zeros((4, 4))
+        board[:2, :2] = [[1, 1], [1, 0]]
+        board[2:, 2:] = [[1, 0], [0, 0]]
+
+        self.assert_array_equal(downsample(board, 2, 0.5), [[1, 0], [0, 0]])
+
+    def test_no_zoom(self):
+        """Test that a zoom of 1 keeps the cells."""
+        board = np.eye(3)
+        self.assert_array_equal(downsample(board, 1), board)
+
+
+class TestToGlyphs(BaseTestCase):
+    """
+    Tests for the to_glyphs function.
+    """
+
+    def test_block(self):
+        """Test one character per cell."""
+        glyphs = to_glyphs(np.array([[0, 1]], dtype=np.uint8), "block")
+        self.assert_array_equal(glyphs, [[ord(" "), ord("█")]])
+
+    def test_half(self):
+        """Test the four combinations of a column of 2 cells."""
+        cells = np.array([[0, 1, 0, 1], [0, 0, 1, 1]], dtype=np.uint8)
+        self.assert_array_equal(
+            to_glyphs(cells, "half"), [[ord(" "), ord("▀"), ord("▄"), ord("█")]]
+        )
+
+    def test_braille(self):
+        """Test the dots of a 4x2 block and an incomplete block."""
+        cells = np.array([[1, 0, 1], [0, 0, 0], [0, 0, 0], [0, 1, 0]], dtype=np.uint8)
+        self.assert_array_equal(to_glyphs(cells, "braille"), [[0x2881, 0x2801]])
+
+        self.assert_array_equal(
+            to_glyphs(np.ones((4, 2), dtype=np.uint8), "braille"), [[0x28FF]]
+        )
+
+    def test_exception_raising(self):
+        """Test when the style does not exist."""
+        cells = np.zeros((2, 2), dtype=np.uint8)
+        self.assertRaises(TypeError, to_glyphs, cells, "nil")
+        self.assertRaises(TypeError, Viewport, 2, 2, style="nil")
+
+
+class TestViewport(BaseTestCase):
+    """
+    Tests for the Viewport class.
+    """
+
+    def test_window(self):
+        """Test that only the cells of the window are drawn."""
+        board = np.zeros((100, 200))
+        board[10, 20] = 1
+        viewport = Viewport(3, 4, top=9, left=18, style="block")
+
+        glyphs = viewport.glyphs(board)
+
+        self.assertEqual(glyphs.shape, (3, 4))
+        expected_glyphs = np.full((3, 4), ord(" "))
+        expected_glyphs[1, 2] = ord("█")
+        self.assert_array_equal(glyphs, expected_glyphs)
+
+    def test_window_size(self):
+        """Test that the characters fit in the window for each style and\
+        zoom, and are cut at the edges of the board."""
+        board = np.ones((1000, 1000))
+        for style in ["block", "half", "braille"]:
+            for zoom in [1, 3]:
+                with self.subTest(style=style, zoom=zoom):
+                    viewport = Viewport(24, 80, zoom=zoom, style=style)
+                    self.assertEqual(viewport.glyphs(board).shape, (24, 80))
+
+                    viewport.move(990, 990)
+                    glyphs = viewport.glyphs(board)
+                    self.assertLess(glyphs.shape[0], 24)
+                    self.assertLess(glyphs.shape[1], 80)
+
+    def test_zoom(self):
+        """Test that a zoomed out braille character covers 4x2 blocks."""
+        board = np.zeros((16, 8))
+        board[15, 7] = 1
+        viewport = Viewport(1, 1, zoom=4, style="braille")
+
+        self.assert_array_equal(viewport.glyphs(board), [[0x2880]])
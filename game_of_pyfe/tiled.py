@@ -0,0 +1,141 @@
+"""
+Tiled game of life implementation.
+
+The board is divided into square tiles and only the tiles that changed in
+the previous generation, together with their neighbor tiles, are
+recomputed. Every other tile is known to keep its state, as its fields
+did not change.
+"""
+
+from typing import Literal, Tuple, Union
+
+import numpy as np
+
+from .core import _apply_rule, _gather_window, _neighborhood_sum, as_cells
+from .rules import CONWAY, Rule, parse_rule
+
+
+def _tile_grid_shape(board_shape: Tuple[int, int], tile_size: int) -> Tuple[int, int]:
+    """Obtain the number of tiles along each axis of the board."""
+    return (-(-board_shape[0] // tile_size), -(-board_shape[1] // tile_size))
+
+
+def grow_tiles(tiles: np.array, mode: Literal["wrap", "zeros"] = "wrap") -> np.array:
+    """Mark the tiles next to the marked tiles, diagonals included.
+
+    Arguments
+    ---------
+    tiles: Boolean array with a value per tile.
+    mode: Edge behavior, "wrap" or "zeros".
+
+    Returns
+    -------
+    The marked tiles together with their neighbors.
+    """
+    if mode == "wrap":
+        rows = tiles | np.roll(tiles, 1, axis=0) | np.roll(tiles, -1, axis=0)
+        return rows | np.roll(rows, 1, axis=1) | np.roll(rows, -1, axis=1)
+    elif mode == "zeros":
+        rows = tiles.copy()
+        rows[1:] |= tiles[:-1]
+        rows[:-1] |= tiles[1:]
+        grown = rows.copy()
+        grown[:, 1:] |= rows[:, :-1]
+        grown[:, :-1] |= rows[:, 1:]
+        return grown
+
+    raise TypeError("Mode not defined.")
+
+
+def update_tiled_board(
+    board: np.array,
+    active_tiles: np.array,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    tile_size: int = 64,
+    rule: Union[str, Rule] = CONWAY,
+) -> Tuple[np.array, np.array]:
+    """Move one generation in the game of life, recomputing only some tiles.
+
+    The operation is inmutable.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    active_tiles: Boolean array with the tiles to recompute, with shape
+    (ceil(n / tile_size), ceil(m / tile_size)).
+    mode: Edge behavior, "wrap" or "zeros".
+    tile_size: Number of cells of each side of a tile.
+    rule: Life-like rule or its B/S notation.
+
+    Returns
+    -------
+    The new board one generation older and the boolean array of the tiles
+    that changed.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+    assert active_tiles.shape == _tile_grid_shape(board_shape, tile_size)
+
+    if mode not in ("wrap", "zeros"):
+        raise TypeError("Mode not defined.")
+
+    rule = parse_rule(rule)
+    board = as_cells(board)
+    new_board = board.copy()
+    changed_tiles = np.zeros_like(active_tiles, dtype=bool)
+
+    for i, j in np.argwhere(active_tiles):
+        rows = slice(i * tile_size, min((i + 1) * tile_size, board_shape[0]))
+        cols = slice(j * tile_size, min((j + 1) * tile_size, board_shape[1]))
+
+        tile = board[rows, cols]
+        padded_tile = _gather_window(
+            board, rows.start - 1, rows.stop + 1, cols.start - 1, cols.stop + 1, mode
+        )
+        total = _neighborhood_sum(padded_tile)
+        new_tile = _apply_rule(tile, total, rule)
+
+        if not np.array_equal(new_tile, tile):
+            new_board[rows, cols] = new_tile
+            changed_tiles[i, j] = True
+
+    return new_board, changed_tiles
+
+
+def evolve_tiled_board(
+    board: np.array,
+    n_times: int,
+    mode: Literal["wrap", "zeros"] = "wrap",
+    tile_size: int = 64,
+    rule: Union[str, Rule] = CONWAY,
+) -> Tuple[np.array, int]:
+    """
+    Iterate through a board `n` generations skipping the stable tiles.
+
+    Arguments
+    ---------
+    board: Game of life board with shape (n, m) where
+    n >= 2 and m >= 2
+    mode: Edge behavior, "wrap" or "zeros".
+    tile_size: Number of cells of each side of a tile.
+    rule: Life-like rule or its B/S notation.
+
+    Yields
+    ------
+    a new board with the state the current generation and the number of
+    tiles that were recomputed to obtain it.
+    """
+    board_shape = board.shape
+    assert board_shape[0] >= 2 and board_shape[1] >= 2
+
+    rule = parse_rule(rule)
+    new_board = as_cells(board)
+    active_tiles = np.ones(_tile_grid_shape(board_shape, tile_size), dtype=bool)
+
+    for _ in range(n_times):
+        new_board, changed_tiles = update_tiled_board(
+            new_board, active_tiles, mode, tile_size, rule
+        )
+        yield new_board, int(np.count_nonzero(active_tiles))
+        active_tiles = grow_tiles(changed_tiles, mode)
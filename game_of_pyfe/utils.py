@@ -6,6 +6,8 @@
 
 import numpy as np
 
+from .core import CELL_DTYPE
+
 
 def cls():
     """Clean the terminal."""
@@ -19,6 +21,9 @@ def validate_board(board: np.array) -> np.array:
     1. Has shape of (n, m).
     2. Only contains 1's (life) and 0's (death).
 
+    The values are checked with array operations and the position of the
+    first invalid value is only searched when the board is not valid.
+
     Arguments
     ---------
     board: Game of life board.
@@ -30,21 +35,33 @@ def validate_board(board: np.array) -> np.array:
 
     Returns
     -------
-    The original board.
+    The original board with a one byte dtype. Boards that are already
+    bool or uint8 are returned without a copy.
     """
     board_shape = board.shape
 
     if not (len(board_shape) == 2 and board_shape[0] >= 2 and board_shape[1] >= 2):
         raise TypeError("board does not contain the correct shape")
 
-    for i in range(board_shape[0]):
-        for j in range(board_shape[1]):
-            if not (board[i][j] == 0 or board[i][j] == 1):
-                raise ValueError(
-                    "Board contains a {} in index [{}, {}]".format(board[i][j], i, j)
-                )
+    if board.dtype == bool:
+        return board
+
+    if board.dtype.kind in "iu":
+        # Negative values of signed integers are huge unsigned integers, so
+        # a single maximum checks both limits.
+        unsigned = board.view(board.dtype.str.replace("i", "u"))
+        valid = unsigned.max() <= 1
+    else:
+        valid = np.all((board == 0) | (board == 1))
 
-    return board
+    if not valid:
+        invalid = (board != 0) & (board != 1)
+        i, j = np.unravel_index(np.argmax(invalid), board_shape)
+        raise ValueError(
+            "Board contains a {} in index [{}, {}]".format(board[i][j], i, j)
+        )
+
+    return board.astype(CELL_DTYPE, copy=False)
 
 
 def create_printable_board(board: np.array) -> List[List[int]]:
@@ -62,12 +79,9 @@ def create_printable_board(board: np.array) -> List[List[int]]:
     A list containing the lines of integers representing each cell
     life state.
     """
-    black_square = 9608
-    space = 32
-
-    printable_board = board.copy()
+    black_square = np.uint16(9608)
+    space = np.uint16(32)
 
-    printable_board[printable_board == 0] = space
-    printable_board[printable_board == 1] = black_square
+    printable_board = np.where(board != 0, black_square, space)
 
     return printable_board.tolist()
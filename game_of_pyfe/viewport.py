@@ -0,0 +1,178 @@
+"""
+Viewport of game of pyfe boards.
+
+A viewport is the window of a board shown in the terminal. Only the cells
+inside the window are converted into characters, so the cost of each
+frame depends on the size of the terminal instead of the board. Each
+character can show several cells:
+
+1. "block", one cell per character with a full block.
+2. "half", 2 cells stacked in a character with the upper and lower half
+   blocks.
+3. "braille", 2x4 cells per character with the dots of the braille
+   patterns.
+
+Zoomed out viewports merge zoom x zoom cells into one, which is alive
+when the density of living cells is above min_density.
+"""
+
+from typing import Literal, Tuple
+
+import numpy as np
+
+Style = Literal["block", "half", "braille"]
+
+# Rows and columns of cells in a character of each style.
+GLYPH_CELLS = {"block": (1, 1), "half": (2, 1), "braille": (4, 2)}
+
+_BLOCK_GLYPHS = np.array([ord(" "), ord("█")], dtype="<u4")
+# Indexed by the upper cell plus 2 times the lower cell.
+_HALF_GLYPHS = np.array([ord(" "), ord("▀"), ord("▄"), ord("█")], dtype="<u4")
+_BRAILLE_BASE = 0x2800
+# Bit of the braille dot of each (row, column) cell of a character.
+_BRAILLE_BITS = np.array(
+    [[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]], dtype="<u4"
+)
+
+
+def downsample(board: np.array, zoom: int, min_density: float = 0.0) -> np.array:
+    """Merge each zoom x zoom block of cells into a single cell.
+
+    Arguments
+    ---------
+    board: Game of life board.
+    zoom: Number of rows and columns of cells merged.
+    min_density: A merged cell is alive when the fraction of living cells
+    of its block is above min_density, so by default any living cell.
+
+    Returns
+    -------
+    The uint8 board with shape (ceil(n / zoom), ceil(m / zoom)). The blocks
+    of the last rows and columns are completed with dead cells.
+    """
+    if zoom == 1:
+        return (board != 0).view(np.uint8)
+
+    n, m = board.shape
+    blocks = np.zeros((-(-n // zoom) * zoom, -(-m // zoom) * zoom), dtype=np.uint8)
+    blocks[:n, :m] = board != 0
+
+    population = blocks.reshape(
+        blocks.shape[0] // zoom, zoom, blocks.shape[1] // zoom, zoom
+    ).sum(axis=(1, 3), dtype=np.uint32)
+
+    return (population > min_density * zoom ** 2).view(np.uint8)
+
+
+def _glyph_blocks(cells: np.array, glyph_rows: int, glyph_columns: int) -> np.array:
+    """Split the cells into the blocks of cells of each character.
+
+    The blocks have shape (rows, columns, glyph_rows, glyph_columns) and
+    are completed with dead cells.
+    """
+    n, m = cells.shape
+    rows, columns = -(-n // glyph_rows), -(-m // glyph_columns)
+
+    blocks = np.zeros((rows * glyph_rows, columns * glyph_columns), dtype=np.uint8)
+    blocks[:n, :m] = cells
+
+    return blocks.reshape(rows, glyph_rows, columns, glyph_columns).swapaxes(1, 2)
+
+
+def to_glyphs(cells: np.array, style: Style = "block") -> np.array:
+    """Convert cells into the code points of the characters showing them.
+
+    Arguments
+    ---------
+    cells: Board of 0's and 1's.
+    style: Characters used, "block", "half" or "braille".
+
+    Raises
+    ------
+    TypeError if the style does not exist.
+
+    Returns
+    -------
+    The uint32 code points with one entry per character.
+    """
+    if style == "block":
+        return _BLOCK_GLYPHS[cells]
+    if style == "half":
+        blocks = _glyph_blocks(cells, 2, 1)
+        return _HALF_GLYPHS[blocks[:, :, 0, 0] + 2 * blocks[:, :, 1, 0]]
+    if style == "braille":
+        blocks = _glyph_blocks(cells, 4, 2)
+        dots = (blocks * _BRAILLE_BITS).sum(axis=(2, 3), dtype=np.uint32)
+        return _BRAILLE_BASE + dots
+
+    raise TypeError("Style not defined.")
+
+
+class Viewport:
+    """Window of a board shown in the terminal.
+
+    Arguments
+    ---------
+    height: Number of rows of characters.
+    width: Number of columns of characters.
+    top: First row of cells shown.
+    left: First column of cells shown.
+    zoom: Number of rows and columns of cells merged into one.
+    style: Characters used, "block", "half" or "braille".
+    min_density: Density of living cells above which a merged cell is
+    alive.
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        top: int = 0,
+        left: int = 0,
+        zoom: int = 1,
+        style: Style = "block",
+        min_density: float = 0.0,
+    ):
+        assert height >= 1 and width >= 1 and zoom >= 1
+        if style not in GLYPH_CELLS:
+            raise TypeError("Style not defined.")
+
+        self.height = height
+        self.width = width
+        self.top = top
+        self.left = left
+        self.zoom = zoom
+        self.style = style
+        self.min_density = min_density
+
+    @property
+    def cells(self) -> Tuple[int, int]:
+        """Rows and columns of board cells inside the window."""
+        glyph_rows, glyph_columns = GLYPH_CELLS[self.style]
+
+        return (
+            self.height * glyph_rows * self.zoom,
+            self.width * glyph_columns * self.zoom,
+        )
+
+    def move(self, top: int, left: int) -> None:
+        """Move the window to start in the cell (top, left)."""
+        self.top, self.left = max(top, 0), max(left, 0)
+
+    def glyphs(self, board: np.array) -> np.array:
+        """Obtain the characters of the window of a board.
+
+        Arguments
+        ---------
+        board: Game of life board.
+
+        Returns
+        -------
+        The uint32 code points of the characters, with at most (height,
+        width) entries. Windows reaching past the board are cut at its
+        edges.
+        """
+        rows, columns = self.cells
+        visible = board[self.top : self.top + rows, self.left : self.left + columns]
+
+        return to_glyphs(downsample(visible, self.zoom, self.min_density), self.style)
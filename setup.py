@@ -51,6 +51,9 @@ def read(fname):
     # doesn't exist
     pass
 
+# Optional compiled kernels, see game_of_pyfe.backends
+extras_require["numba"] = ["numba"]
+
 
 # If there are any extras, add a catch-all case that includes everything.
 # This assumes that entries in extras_require are lists (not single strings).
@@ -177,6 +180,11 @@ def run(self):
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
     ],
+    entry_points={
+        "console_scripts": [
+            "game-of-pyfe = game_of_pyfe.cli:main",
+        ],
+    },
     # Could also include keywords, download_url, project_urls, etc.
     # Custom commands
     cmdclass={